@@ -9,7 +9,10 @@ from .data_crypto import (
     compute_hmac,
     validate_hmac_constant_time,
     compute_packet_hmac,
+    packet_hmac_signer,
     validate_packet_hmac,
+    validate_packet_hmac_raw,
+    clear_hmac_cache,
 )
 
 __all__ = [
@@ -17,5 +20,8 @@ __all__ = [
     "compute_hmac",
     "validate_hmac_constant_time",
     "compute_packet_hmac",
+    "packet_hmac_signer",
     "validate_packet_hmac",
+    "validate_packet_hmac_raw",
+    "clear_hmac_cache",
 ]
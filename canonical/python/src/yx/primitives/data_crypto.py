@@ -4,8 +4,61 @@ Data Cryptography Primitives - HMAC, AES-GCM, etc.
 Implements: specs/technical/yx-protocol-spec.md § Security Mechanisms
 """
 
+import hashlib
 import hmac as hmac_module
-from cryptography.hazmat.primitives import hashes, hmac
+from functools import lru_cache
+from typing import Callable, Tuple
+
+# SHA-256 block size and the RFC 2104 pad tables (key byte XOR 0x36 / 0x5C)
+_BLOCK_SIZE = 64
+_IPAD = bytes(b ^ 0x36 for b in range(256))
+_OPAD = bytes(b ^ 0x5C for b in range(256))
+
+
+def _hmac_pads(key: bytes) -> Tuple["hashlib._Hash", "hashlib._Hash"]:
+    """
+    Return the cached (inner, outer) pad states for any bytes-like key.
+
+    The cache is keyed by value, so bytearray/memoryview keys are copied
+    to bytes first (they are unhashable and could change after caching).
+    """
+    if type(key) is not bytes:
+        key = bytes(key)
+    return _key_pads(key)
+
+
+@lru_cache(maxsize=8)
+def _key_pads(key: bytes) -> Tuple["hashlib._Hash", "hashlib._Hash"]:
+    """
+    Return (inner, outer) SHA-256 states that have absorbed key^ipad, key^opad.
+
+    HMAC(K, m) = H((K ^ opad) || H((K ^ ipad) || m)). Both pad blocks are
+    hashed once per key; callers `.copy()` each state before updating it,
+    so a MAC costs two C-level hash copies with no hmac.HMAC wrapper in
+    between.
+
+    Keys are cached by value, so a fresh but equal `bytes` object still
+    hits. The cache holds the 8 most recently used keys: with more than 8
+    peer keys in active rotation they evict each other and every MAC
+    re-hashes both pad blocks. Callers juggling that many keys should
+    keep their own per-peer signer (see packet_hmac_signer).
+    """
+    # hashlib.sha256 is OpenSSL's EVP SHA-256 (SHA-NI/AVX2 where the CPU has
+    # them); copying these states beats a one-shot hmac.digest() at every
+    # payload size because the payload never has to be joined to the GUID
+    if len(key) > _BLOCK_SIZE:
+        key = hashlib.sha256(key).digest()
+    key = key.ljust(_BLOCK_SIZE, b'\x00')
+    return hashlib.sha256(key.translate(_IPAD)), hashlib.sha256(key.translate(_OPAD))
+
+
+def clear_hmac_cache() -> None:
+    """
+    Drop all cached HMAC key schedules.
+
+    Call after key rotation so retired keys are not kept in memory.
+    """
+    _key_pads.cache_clear()
 
 
 def compute_hmac(data: bytes, key: bytes, truncate_to: int = 16) -> bytes:
@@ -36,10 +89,12 @@ def compute_hmac(data: bytes, key: bytes, truncate_to: int = 16) -> bytes:
     if truncate_to > 32:
         raise ValueError(f"Cannot truncate to more than 32 bytes, got {truncate_to}")
 
-    h = hmac.HMAC(key, hashes.SHA256())
-    h.update(data)
-    mac = h.finalize()
-    return mac[:truncate_to]
+    inner_pad, outer_pad = _hmac_pads(key)
+    inner = inner_pad.copy()
+    inner.update(data)
+    outer = outer_pad.copy()
+    outer.update(inner.digest())
+    return outer.digest()[:truncate_to]
 
 
 def validate_hmac_constant_time(
@@ -68,6 +123,10 @@ def validate_hmac_constant_time(
         True
     """
     try:
+        # A tag of the wrong length can never match, so skip hashing it.
+        # Only the public length is checked early, never the tag contents
+        if len(expected_hmac) != truncate_to:
+            return False
         computed_hmac = compute_hmac(data, key, truncate_to)
         # Use constant-time comparison to prevent timing attacks
         return hmac_module.compare_digest(computed_hmac, expected_hmac)
@@ -97,9 +156,58 @@ def compute_packet_hmac(guid: bytes, payload: bytes, key: bytes) -> bytes:
     """
     if len(guid) != 6:
         raise ValueError(f"GUID must be 6 bytes, got {len(guid)}")
+    if len(key) != 32:
+        raise ValueError(f"Key must be 32 bytes, got {len(key)}")
+
+    # HMAC is streaming: absorbing GUID then payload equals HMAC(GUID + Payload)
+    # without allocating and copying the concatenation
+    inner_pad, outer_pad = _hmac_pads(key)
+    inner = inner_pad.copy()
+    inner.update(guid)
+    inner.update(payload)
+    outer = outer_pad.copy()
+    outer.update(inner.digest())
+    return outer.digest()[:16]
 
-    hmac_input = guid + payload
-    return compute_hmac(hmac_input, key, truncate_to=16)
+
+def packet_hmac_signer(key: bytes) -> Callable[[bytes, bytes], bytes]:
+    """
+    Bind a key once and return a function computing packet HMACs under it.
+
+    Intended for senders that reuse one key for many packets: the key is
+    validated and its HMAC schedule looked up once, not on every packet.
+
+    Args:
+        key: 32-byte symmetric key
+
+    Returns:
+        Callable taking (guid, payload) and returning the 16-byte HMAC.
+        The GUID must already be padded to 6 bytes.
+
+    Raises:
+        ValueError: If key is not 32 bytes
+
+    Example:
+        >>> key = b'\\x00' * 32
+        >>> guid = b'\\x01' * 6
+        >>> sign = packet_hmac_signer(key)
+        >>> sign(guid, b'test') == compute_packet_hmac(guid, b'test', key)
+        True
+    """
+    if len(key) != 32:
+        raise ValueError(f"Key must be 32 bytes, got {len(key)}")
+
+    inner_pad, outer_pad = _hmac_pads(key)
+
+    def sign(guid: bytes, payload: bytes) -> bytes:
+        inner = inner_pad.copy()
+        inner.update(guid)
+        inner.update(payload)
+        outer = outer_pad.copy()
+        outer.update(inner.digest())
+        return outer.digest()[:16]
+
+    return sign
 
 
 def validate_packet_hmac(
@@ -129,7 +237,47 @@ def validate_packet_hmac(
         True
     """
     try:
+        # Malformed tags are rejected without hashing (length only, see above)
+        if len(expected_hmac) != 16:
+            return False
         computed_hmac = compute_packet_hmac(guid, payload, key)
         return hmac_module.compare_digest(computed_hmac, expected_hmac)
     except (ValueError, TypeError):
         return False
+
+
+def validate_packet_hmac_raw(data: bytes, key: bytes) -> bool:
+    """
+    Validate HMAC of a serialized YX packet without parsing it.
+
+    The wire format stores GUID + Payload contiguously after the HMAC, so
+    the MAC is computed over a view of the raw datagram instead of over
+    sliced copies of each field.
+
+    Args:
+        data: Raw packet bytes (HMAC + GUID + Payload)
+        key: 32-byte symmetric key
+
+    Returns:
+        bool: True if valid, False if too short or HMAC mismatch
+
+    Example:
+        >>> key = b'\\x00' * 32
+        >>> guid = b'\\x01' * 6
+        >>> mac = compute_packet_hmac(guid, b'test', key)
+        >>> validate_packet_hmac_raw(mac + guid + b'test', key)
+        True
+    """
+    try:
+        if len(data) < 22 or len(key) != 32:
+            return False
+
+        view = memoryview(data)
+        inner_pad, outer_pad = _hmac_pads(key)
+        inner = inner_pad.copy()
+        inner.update(view[16:])
+        outer = outer_pad.copy()
+        outer.update(inner.digest())
+        return hmac_module.compare_digest(outer.digest()[:16], view[:16])
+    except (ValueError, TypeError):
+        return False
@@ -0,0 +1,220 @@
+"""
+Batched Datagram I/O - Send and receive many UDP datagrams.
+
+Receiving uses Linux recvmmsg(2) through ctypes when available; everywhere
+else (and for IPv6 sockets) it falls back to one recvfrom_into() per
+datagram. Sending is one sendto() per datagram: sendmmsg(2) through ctypes
+measured no faster, since per-datagram kernel work dominates and filling
+its headers from Python costs what the saved system calls would.
+"""
+
+import ctypes
+import errno
+import select
+import socket
+import struct
+import sys
+import threading
+from typing import Iterable, List, Tuple
+
+# Smallest read worth a recvmmsg call; below this the ctypes overhead
+# outweighs the saved system calls (see tests/bench_batch_io.py)
+MIN_RECV_BATCH = 3
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", _MsgHdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+def _load_recvmmsg():
+    """Return libc's recvmmsg with argtypes set, or None if unavailable."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        func = ctypes.CDLL(None, use_errno=True).recvmmsg
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    func.restype = ctypes.c_int
+    return func
+
+
+_recvmmsg = _load_recvmmsg()
+_MSG_DONTWAIT = getattr(socket, 'MSG_DONTWAIT', None)
+if _MSG_DONTWAIT is None:
+    # Without it recvmmsg would block; use the select loop instead
+    _recvmmsg = None
+
+# Per-thread ctypes arrays, reused across calls. ctypes releases the GIL
+# while the system call runs, so these must never be shared by threads
+_local = threading.local()
+
+# socket.socket.family wraps the raw int in an IntEnum on every access,
+# which costs more than a small recvmmsg call; read the int directly
+_socket_family = socket.SocketType.family.__get__
+
+# struct sockaddr_in: family (native, skipped), port and IPv4 address
+# (network order), zero padding
+_SOCKADDR_IN = struct.Struct('!2xH4s8x')
+
+# msg_len within each struct mmsghdr, for decoding a run of headers at once
+_MMSG_LEN = struct.Struct(
+    f'={_MMsgHdr.msg_len.offset}xI{ctypes.sizeof(_MMsgHdr) - _MMsgHdr.msg_len.offset - 4}x'
+)
+
+
+def send_datagrams(sock: socket.socket, messages: Iterable[Tuple[bytes, Tuple[str, int]]]) -> int:
+    """
+    Send (data, (host, port)) datagrams with one sendto each.
+
+    Args:
+        sock: UDP socket
+        messages: Datagrams and their destinations, sent in order
+
+    Returns:
+        int: Number of datagrams sent
+
+    Raises:
+        OSError: If sending fails
+    """
+    sendto = sock.sendto
+    sent = 0
+    for data, addr in messages:
+        sendto(data, addr)
+        sent += 1
+    return sent
+
+
+def _recvmmsg_batch(
+    sock: socket.socket,
+    view: memoryview,
+    slot_size: int,
+    count: int
+) -> List[Tuple[int, Tuple[str, int]]]:
+    """
+    Read up to `count` queued datagrams with one non-blocking recvmmsg call.
+
+    MSG_DONTWAIT makes this call non-blocking without touching the socket's
+    own blocking/timeout mode, which other threads may rely on.
+
+    Raises:
+        OSError: On any recvmmsg failure other than an empty queue
+    """
+    if len(view) < slot_size * count:
+        raise ValueError(f"buffer holds {len(view)} bytes, need {slot_size * count}")
+    # Exporting the buffer pins it until the call returns
+    anchor = ctypes.c_char.from_buffer(view)
+
+    # Slot addresses depend only on (base, slot_size, count), so the
+    # headers built for the previous call are reused whenever they match
+    layout = (ctypes.addressof(anchor), slot_size, count)
+    plan = getattr(_local, 'recv_plan', None)
+    if plan is None or plan[0] != layout:
+        plan = _local.recv_plan = (layout, *_build_recv_arrays(*layout))
+    _, headers, raw_headers, raw_names = plan
+
+    received = _recvmmsg(sock.fileno(), headers, count, _MSG_DONTWAIT, None)
+    if received < 0:
+        err = ctypes.get_errno()
+        if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+            return []
+        raise OSError(err, f"recvmmsg failed: {errno.errorcode.get(err, err)}")
+
+    # The kernel fills msg_len and the names; msg_namelen is written back
+    # as 16 for AF_INET, so the headers are ready for the next call as-is
+    lengths = _MMSG_LEN.iter_unpack(raw_headers[:received * _MMSG_LEN.size])
+    names = _SOCKADDR_IN.iter_unpack(raw_names[:received * _SOCKADDR_IN.size])
+    return [
+        (nbytes, (socket.inet_ntoa(ip), port))
+        for (nbytes,), (port, ip) in zip(lengths, names)
+    ]
+
+
+def _build_recv_arrays(base: int, slot_size: int, count: int):
+    """
+    Build recvmmsg headers pointing at `count` slots starting at `base`.
+
+    Returns:
+        (headers, raw_headers, raw_names): the headers plus byte views of
+        them and of the sockaddr array, for decoding a batch in one step
+    """
+    headers = (_MMsgHdr * count)()
+    iovecs = (_IOVec * count)()
+    names = (ctypes.c_char * (_SOCKADDR_IN.size * count))()
+    name_base = ctypes.addressof(names)
+
+    for i in range(count):
+        iovecs[i].iov_base = base + i * slot_size
+        iovecs[i].iov_len = slot_size
+        hdr = headers[i].msg_hdr
+        hdr.msg_name = name_base + _SOCKADDR_IN.size * i
+        hdr.msg_namelen = _SOCKADDR_IN.size
+        hdr.msg_iov = ctypes.pointer(iovecs[i])
+        hdr.msg_iovlen = 1
+    return headers, memoryview(headers).cast('B'), memoryview(names).cast('B')
+
+
+def recv_datagrams(
+    sock: socket.socket,
+    buffer: memoryview,
+    slot_size: int,
+    count: int
+) -> List[Tuple[int, Tuple[str, int]]]:
+    """
+    Read datagrams that are already queued, without waiting for more.
+
+    Datagram i is written to buffer[i * slot_size:(i + 1) * slot_size];
+    anything longer than slot_size is truncated. On Linux (IPv4), reads of
+    MIN_RECV_BATCH or more datagrams are a single recvmmsg call. Otherwise
+    each datagram costs a zero-timeout select plus a recvfrom_into. A concurrent reader on the same socket
+    can steal a datagram between those two calls, and the read then waits
+    for the socket's own timeout.
+
+    Args:
+        sock: UDP socket
+        buffer: Writable buffer of at least slot_size * count bytes
+        slot_size: Bytes reserved per datagram
+        count: Maximum datagrams to read
+
+    Returns:
+        List of (nbytes, (host, port)), one per slot filled, in order
+
+    Raises:
+        OSError: If receiving fails
+    """
+    if count <= 0:
+        return []
+
+    view = memoryview(buffer).cast('B')
+    if _recvmmsg is not None and count >= MIN_RECV_BATCH and _socket_family(sock) == socket.AF_INET:
+        return _recvmmsg_batch(sock, view, slot_size, count)
+
+    results = []
+    for i in range(count):
+        readable, _, _ = select.select([sock], [], [], 0)
+        if not readable:
+            break
+        results.append(sock.recvfrom_into(view[i * slot_size:(i + 1) * slot_size], slot_size))
+    return results
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, init=False)
 class Packet:
     """
     YX Protocol Packet.
@@ -17,25 +17,44 @@ class Packet:
         HMAC (16 bytes) + GUID (6 bytes) + Payload (variable)
 
     Minimum packet size: 22 bytes (16 + 6 + 0)
+
+    Packets are immutable and slotted (no per-instance __dict__), so the
+    wire form is computed at most once and reused by later to_bytes() calls.
     """
 
+    # Declared by hand rather than with slots=True so the to_bytes() memo
+    # gets a slot without being a dataclass field (fields(), asdict(),
+    # astuple() and replace() see only the three wire fields)
+    __slots__ = ('hmac', 'guid', 'payload', '_cached')
+
     hmac: bytes      # 16 bytes
     guid: bytes      # 6 bytes
     payload: bytes   # Variable length
 
-    def __post_init__(self):
-        """Validate packet fields."""
-        if not isinstance(self.hmac, bytes):
-            raise TypeError(f"hmac must be bytes, got {type(self.hmac)}")
-        if not isinstance(self.guid, bytes):
-            raise TypeError(f"guid must be bytes, got {type(self.guid)}")
-        if not isinstance(self.payload, bytes):
-            raise TypeError(f"payload must be bytes, got {type(self.payload)}")
+    def __init__(self, hmac: bytes, guid: bytes, payload: bytes):
+        """
+        Validate and store packet fields.
 
-        if len(self.hmac) != 16:
-            raise ValueError(f"hmac must be 16 bytes, got {len(self.hmac)}")
-        if len(self.guid) != 6:
-            raise ValueError(f"guid must be 6 bytes, got {len(self.guid)}")
+        Written by hand rather than generated: the frozen dataclass
+        __init__ stores each field with object.__setattr__, which more
+        than doubled construction time.
+        """
+        if not isinstance(hmac, bytes):
+            raise TypeError(f"hmac must be bytes, got {type(hmac)}")
+        if not isinstance(guid, bytes):
+            raise TypeError(f"guid must be bytes, got {type(guid)}")
+        if not isinstance(payload, bytes):
+            raise TypeError(f"payload must be bytes, got {type(payload)}")
+
+        if len(hmac) != 16:
+            raise ValueError(f"hmac must be 16 bytes, got {len(hmac)}")
+        if len(guid) != 6:
+            raise ValueError(f"guid must be 6 bytes, got {len(guid)}")
+
+        _set_hmac(self, hmac)
+        _set_guid(self, guid)
+        _set_payload(self, payload)
+        _set_cached(self, None)
 
     def to_bytes(self) -> bytes:
         """
@@ -50,7 +69,12 @@ class Packet:
             >>> len(data)
             26
         """
-        return self.hmac + self.guid + self.payload
+        cached = self._cached
+        if cached is None:
+            # join sizes the result up front: one allocation, one copy of payload
+            cached = b''.join((self.hmac, self.guid, self.payload))
+            _set_cached(self, cached)
+        return cached
 
     @classmethod
     def from_bytes(cls, data: bytes) -> Optional["Packet"]:
@@ -73,21 +97,89 @@ class Packet:
             return None
 
         try:
-            hmac = data[0:16]
-            guid = data[16:22]
-            payload = data[22:]
-            return cls(hmac=hmac, guid=guid, payload=payload)
-        except (TypeError, ValueError):
+            return cls._split(data)
+        except TypeError:
             return None
 
+    @classmethod
+    def from_validated_bytes(cls, data: bytes) -> "Packet":
+        """
+        Deserialize packet whose length and HMAC were already checked.
+
+        Skips the field validation in __init__: slicing at fixed
+        offsets of an authenticated datagram (>= 22 bytes) guarantees it.
+
+        Args:
+            data: Raw packet bytes that passed validate_packet_hmac_raw
+
+        Returns:
+            Packet
+        """
+        return cls._split(data)
+
+    @classmethod
+    def _split(cls, data: bytes) -> "Packet":
+        """
+        Slice a serialized packet of at least 22 bytes into its fields.
+
+        Fixed-offset slices always satisfy the field checks. Non-bytes
+        buffers (bytearray, memoryview) are sliced through a memoryview so
+        each field is copied exactly once, not the whole datagram first.
+
+        Raises:
+            TypeError: If data does not support the buffer protocol
+        """
+        if type(data) is bytes:
+            return cls._unchecked(data[0:16], data[16:22], data[22:])
+        view = memoryview(data).cast('B')
+        return cls._unchecked(bytes(view[0:16]), bytes(view[16:22]), bytes(view[22:]))
+
+    @classmethod
+    def _unchecked(cls, hmac: bytes, guid: bytes, payload: bytes) -> "Packet":
+        """
+        Construct a packet without running the __init__ validation.
+
+        For internal callers that already guarantee 16-byte hmac, 6-byte
+        guid and bytes fields; user code should call Packet(...) instead.
+        """
+        packet = object.__new__(cls)
+        _set_hmac(packet, hmac)
+        _set_guid(packet, guid)
+        _set_payload(packet, payload)
+        _set_cached(packet, None)
+        return packet
+
+    def __reduce__(self):
+        """
+        Pickle only the three wire fields.
+
+        The default slots pickling would also store the memoized to_bytes()
+        result, roughly doubling the pickled size of a serialized packet.
+        """
+        return (type(self), (self.hmac, self.guid, self.payload))
+
     def __len__(self) -> int:
         """Return total packet size in bytes."""
         return 16 + 6 + len(self.payload)
 
     def __repr__(self) -> str:
-        """Return string representation."""
+        """
+        Return string representation.
+
+        Only evaluated on demand (logging formats %r lazily); hex-encodes
+        just the 4 HMAC bytes shown rather than all 16.
+        """
         return (
-            f"Packet(hmac={self.hmac.hex()[:8]}..., "
+            f"Packet(hmac={self.hmac[:4].hex()}..., "
             f"guid={self.guid.hex()}, "
             f"payload={len(self.payload)}B)"
         )
+
+
+# Slot descriptors write straight into an instance, bypassing the frozen
+# __setattr__; much cheaper than object.__setattr__(packet, name, value).
+# Used by __init__, _unchecked and the to_bytes memo
+_set_hmac = Packet.hmac.__set__
+_set_guid = Packet.guid.__set__
+_set_payload = Packet.payload.__set__
+_set_cached = Packet._cached.__set__
@@ -6,7 +6,12 @@ Implements: specs/technical/yx-protocol-spec.md § Packet Building/Parsing Logic
 
 from typing import Optional
 from .packet import Packet
-from ..primitives import GUIDFactory, compute_packet_hmac, validate_packet_hmac
+from ..primitives import (
+    compute_packet_hmac,
+    validate_packet_hmac,
+    validate_packet_hmac_raw,
+)
+from ..primitives.guid_factory import pad_guid
 
 
 class PacketBuilder:
@@ -25,6 +30,9 @@ class PacketBuilder:
         Returns:
             Packet: Complete packet with HMAC
 
+        Raises:
+            TypeError: If guid or payload is not bytes
+
         Example:
             >>> key = b'\\x00' * 32
             >>> guid = b'\\x01' * 6
@@ -33,14 +41,21 @@ class PacketBuilder:
             >>> len(packet.hmac)
             16
         """
-        # Pad GUID to exactly 6 bytes
-        padded_guid = GUIDFactory.pad_guid(guid)
+        # Packets are immutable and hashable, so mutable buffers are rejected
+        # here exactly as Packet.__init__ would
+        if not isinstance(guid, bytes):
+            raise TypeError(f"guid must be bytes, got {type(guid)}")
+        if not isinstance(payload, bytes):
+            raise TypeError(f"payload must be bytes, got {type(payload)}")
+
+        # Pad GUID to exactly 6 bytes (common case is already 6 bytes)
+        padded_guid = guid if len(guid) == 6 else pad_guid(guid)
 
         # Compute HMAC over GUID + Payload
         hmac_value = compute_packet_hmac(padded_guid, payload, key)
 
-        # Create and return packet
-        return Packet(hmac=hmac_value, guid=padded_guid, payload=payload)
+        # Create and return packet (HMAC/GUID sizes are guaranteed above)
+        return Packet._unchecked(hmac_value, padded_guid, payload)
 
     @staticmethod
     def build_and_serialize(guid: bytes, payload: bytes, key: bytes) -> bytes:
@@ -55,14 +70,25 @@ class PacketBuilder:
         Returns:
             bytes: Serialized packet (HMAC + GUID + Payload)
 
+        Raises:
+            TypeError: If guid or payload is not bytes
+
         Example:
             >>> key = b'\\x00' * 32
             >>> data = PacketBuilder.build_and_serialize(b'\\x01'*6, b'test', key)
             >>> len(data)
             26
         """
-        packet = PacketBuilder.build_packet(guid, payload, key)
-        return packet.to_bytes()
+        # Same input contract as build_packet, so the two never disagree
+        if not isinstance(guid, bytes):
+            raise TypeError(f"guid must be bytes, got {type(guid)}")
+        if not isinstance(payload, bytes):
+            raise TypeError(f"payload must be bytes, got {type(payload)}")
+
+        # Send path: skip the intermediate Packet
+        padded_guid = guid if len(guid) == 6 else pad_guid(guid)
+        hmac_value = compute_packet_hmac(padded_guid, payload, key)
+        return b''.join((hmac_value, padded_guid, payload))
 
     @staticmethod
     def parse_packet(data: bytes) -> Optional[Packet]:
@@ -110,11 +136,9 @@ class PacketBuilder:
             >>> packet.payload
             b'test'
         """
-        packet = PacketBuilder.parse_packet(data)
-        if packet is None:
-            return None
-
-        if not PacketBuilder.validate_hmac(packet, key):
+        # Authenticate the raw datagram first; only materialize a Packet
+        # for data that passes, so dropped packets cost no field copies
+        if not validate_packet_hmac_raw(data, key):
             return None
 
-        return packet
+        return Packet.from_validated_bytes(data)
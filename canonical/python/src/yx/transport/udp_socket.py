@@ -1,8 +1,22 @@
 """UDP Socket Configuration for YX Protocol."""
 
 import socket
-from typing import Tuple
+import threading
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+from .batch_io import recv_datagrams, send_datagrams
 from .packet_builder import PacketBuilder
+from ..primitives import packet_hmac_signer, validate_packet_hmac_raw
+from ..primitives.guid_factory import pad_guid
+
+# Requested kernel send/receive buffer size; the OS may clamp it
+SOCKET_BUFFER_SIZE = 8 << 20  # 8 MiB
+
+# Optional Linux options; option numbers differ across architectures, so
+# each is used only when this Python's socket module exports it
+_SO_SNDBUFFORCE = getattr(socket, 'SO_SNDBUFFORCE', None)
+_SO_RCVBUFFORCE = getattr(socket, 'SO_RCVBUFFORCE', None)
+_IP_MTU_DISCOVER = getattr(socket, 'IP_MTU_DISCOVER', None)
+_IP_PMTUDISC_DONT = getattr(socket, 'IP_PMTUDISC_DONT', None)
 
 
 class UDPSocket:
@@ -18,6 +32,20 @@ class UDPSocket:
         self.port = port
         self.socket: socket.socket = None
 
+        # Send-side cache: a sender usually pins one (guid, key) pair. Held
+        # as one (key, guid, signer, padded_guid) tuple and replaced whole,
+        # so concurrent senders never see a signer from one key paired with
+        # another's key or GUID
+        self._send_cache: Tuple[
+            Optional[bytes], Optional[bytes],
+            Optional[Callable[[bytes, bytes], bytes]], Optional[bytes]
+        ] = (None, None, None, None)
+
+        # Reusable receive slots for receive_packets, one set per thread:
+        # datagrams are authenticated in place, so a buffer shared between
+        # threads could be overwritten between validation and copy-out
+        self._recv_local = threading.local()
+
     def create_socket(self) -> socket.socket:
         """
         Create and configure UDP socket.
@@ -43,9 +71,35 @@ class UDPSocket:
         # Enable broadcast
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
 
+        # Enlarge kernel buffers so bursts are not dropped (advisory)
+        self._set_buffer_size(sock, socket.SO_SNDBUF, _SO_SNDBUFFORCE)
+        self._set_buffer_size(sock, socket.SO_RCVBUF, _SO_RCVBUFFORCE)
+
+        # Never set DF, so large datagrams are fragmented rather than dropped
+        if _IP_MTU_DISCOVER is not None and _IP_PMTUDISC_DONT is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_IP, _IP_MTU_DISCOVER, _IP_PMTUDISC_DONT)
+            except OSError:
+                pass
+
         self.socket = sock
         return sock
 
+    @staticmethod
+    def _set_buffer_size(sock: socket.socket, option: int, force_option: Optional[int]):
+        """Request SOCKET_BUFFER_SIZE, bypassing the sysctl cap if privileged."""
+        if force_option is not None:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, force_option, SOCKET_BUFFER_SIZE)
+                return
+            except OSError:
+                # Needs CAP_NET_ADMIN; fall back to the capped option
+                pass
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, SOCKET_BUFFER_SIZE)
+        except OSError:
+            pass
+
     def bind(self):
         """Bind socket to all interfaces."""
         if self.socket is None:
@@ -58,13 +112,81 @@ class UDPSocket:
             self.socket.close()
             self.socket = None
 
+    def _serialize(self, guid: bytes, payload: bytes, key: bytes) -> bytes:
+        """Build wire bytes, reusing the cached signer and padded GUID."""
+        # Re-derive key schedule / padded GUID only when they change. The
+        # cache holds bytes copies, so a bytearray mutated in place between
+        # sends still compares unequal (bytes() of bytes is a no-op)
+        cached_key, cached_guid, signer, padded_guid = self._send_cache
+        if key != cached_key or guid != cached_guid:
+            if key != cached_key:
+                key = bytes(key)
+                signer = packet_hmac_signer(key)
+            else:
+                key = cached_key
+            if guid != cached_guid:
+                guid = bytes(guid)
+                padded_guid = pad_guid(guid)
+            else:
+                guid = cached_guid
+            self._send_cache = (key, guid, signer, padded_guid)
+
+        hmac_value = signer(padded_guid, payload)
+        return b''.join((hmac_value, padded_guid, payload))
+
     def send_packet(self, guid: bytes, payload: bytes, key: bytes, host: str = '255.255.255.255', port: int = 50000):
         """Send YX packet via UDP."""
         if self.socket is None:
             self.create_socket()
 
-        data = PacketBuilder.build_and_serialize(guid, payload, key)
-        self.socket.sendto(data, (host, port))
+        self.socket.sendto(self._serialize(guid, payload, key), (host, port))
+
+    def send_packets(
+        self,
+        packets: Iterable[Tuple[bytes, bytes, Tuple[str, int]]],
+        key: bytes
+    ) -> int:
+        """
+        Send many YX packets, one sendto each.
+
+        The signer and padded GUID are cached (see _serialize), so a burst
+        from one GUID under one key derives them once.
+
+        Args:
+            packets: (guid, payload, (host, port)) tuples, sent in order
+            key: 32-byte symmetric key
+
+        Returns:
+            int: Number of packets sent
+        """
+        if self.socket is None:
+            self.create_socket()
+
+        sendto = self.socket.sendto
+        sent = 0
+        for guid, payload, addr in packets:
+            sendto(self._serialize(guid, payload, key), addr)
+            sent += 1
+        return sent
+
+    def send_many(self, datagrams: Sequence[Tuple[bytes, Tuple[str, int]]]) -> int:
+        """
+        Send already-serialized YX packets, one sendto each.
+
+        For callers that build wire bytes themselves (e.g. with
+        PacketBuilder.build_and_serialize, or to resend a packet to many
+        peers).
+
+        Args:
+            datagrams: (wire_bytes, (host, port)) tuples, sent in order
+
+        Returns:
+            int: Number of datagrams sent
+        """
+        if self.socket is None:
+            self.create_socket()
+
+        return send_datagrams(self.socket, datagrams)
 
     def receive_packet(self, key: bytes, buffer_size: int = 65507) -> Tuple[bytes, bytes, Tuple[str, int]]:
         """
@@ -83,3 +205,61 @@ class UDPSocket:
             raise ValueError("Invalid packet received")
 
         return packet.guid, packet.payload, addr
+
+    def receive_packets(
+        self,
+        key: bytes,
+        max_packets: int = 64,
+        buffer_size: int = 65507
+    ) -> List[Tuple[bytes, bytes, Tuple[str, int]]]:
+        """
+        Receive a batch of YX packets.
+
+        Blocks (per the socket timeout) for the first datagram, then reads
+        whatever else is already queued, up to max_packets, in one
+        recvmmsg(2) call on Linux (see batch_io.recv_datagrams for other
+        platforms). The socket's blocking mode is never changed. Datagrams
+        land in a reusable per-thread buffer and are authenticated in place;
+        only valid packets are copied out. Invalid datagrams are dropped
+        silently. Concurrent callers on one socket each get whichever
+        datagrams they read; no datagram is delivered twice.
+
+        Args:
+            key: 32-byte symmetric key
+            max_packets: Maximum datagrams to read in one call (default: 64)
+            buffer_size: Maximum datagram size (default: 65507)
+
+        Returns:
+            List of (guid, payload, addr) tuples, possibly empty if every
+            datagram read was invalid or max_packets <= 0 (nothing is read)
+
+        Raises:
+            RuntimeError: If socket not created
+            socket.timeout: If no datagram arrives within the socket timeout
+        """
+        if self.socket is None:
+            raise RuntimeError("Socket not created")
+        if max_packets <= 0:
+            return []
+
+        # One slot of buffer_size bytes per datagram, allocated on first use
+        needed = buffer_size * max_packets
+        local = self._recv_local
+        buffer = getattr(local, 'buffer', None)
+        if buffer is None or len(buffer) < needed:
+            buffer = local.buffer = bytearray(needed)
+        view = memoryview(buffer)
+        packets = []
+
+        def consume(offset: int, nbytes: int, addr: Tuple[str, int]):
+            datagram = view[offset:offset + nbytes]
+            if validate_packet_hmac_raw(datagram, key):
+                packets.append((bytes(datagram[16:22]), bytes(datagram[22:]), addr))
+
+        consume(0, *self.socket.recvfrom_into(view[:buffer_size], buffer_size))
+
+        queued = recv_datagrams(self.socket, view[buffer_size:needed], buffer_size, max_packets - 1)
+        for slot, (nbytes, addr) in enumerate(queued, 1):
+            consume(slot * buffer_size, nbytes, addr)
+
+        return packets
@@ -0,0 +1,70 @@
+"""Benchmark batched datagram I/O against the per-datagram loops.
+
+Run from canonical/python:
+
+    PYTHONPATH=src python tests/bench_batch_io.py
+
+Prints microseconds per datagram for each batch size. The batched path is
+only worth keeping where it beats the plain loop.
+"""
+
+import socket
+import time
+from yx.transport import batch_io
+from yx.transport.batch_io import recv_datagrams
+
+BATCH_SIZES = (2, 3, 4, 8, 32, 64)
+ROUNDS = 300
+SLOT_SIZE = 2048
+PAYLOAD = b'\x00' * 64
+
+
+def _pair():
+    """Loopback sender and receiver with room for a full batch in flight."""
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)
+    receiver.bind(('127.0.0.1', 0))
+    receiver.settimeout(1.0)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    return sender, receiver
+
+
+def bench_recv(count: int) -> float:
+    """Return microseconds per datagram for recv_datagrams draining `count`."""
+    sender, receiver = _pair()
+    addr = receiver.getsockname()
+    view = memoryview(bytearray(SLOT_SIZE * count))
+    elapsed = 0.0
+    try:
+        for _ in range(ROUNDS):
+            for _ in range(count):
+                sender.sendto(PAYLOAD, addr)
+            start = time.perf_counter()
+            received = recv_datagrams(receiver, view, SLOT_SIZE, count)
+            elapsed += time.perf_counter() - start
+            assert len(received) == count
+    finally:
+        sender.close()
+        receiver.close()
+    return elapsed / (ROUNDS * count) * 1e6
+
+
+def main():
+    native = batch_io._recvmmsg
+    if native is None:
+        print("recvmmsg not available; nothing to compare")
+        return
+
+    print(f"{'datagrams':>10} {'recvmmsg us':>12} {'loop us':>10}")
+    for count in BATCH_SIZES:
+        batched = bench_recv(count)
+        batch_io._recvmmsg = None
+        try:
+            loop = bench_recv(count)
+        finally:
+            batch_io._recvmmsg = native
+        print(f"{count:>10} {batched:>12.2f} {loop:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
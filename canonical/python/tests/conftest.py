@@ -0,0 +1,39 @@
+"""Shared pytest fixtures for the YX Python test suite."""
+
+import pytest
+from yx.transport import PacketBuilder
+
+# Test modules that open real UDP sockets
+_UDP_MODULES = ("test_udp_", "test_batch_io")
+
+
+def pytest_collection_modifyitems(items):
+    """Mark socket tests serial and pin them to one xdist worker.
+
+    With `pytest -n auto --dist=loadgroup` everything else spreads across
+    workers, while the UDP tests share their module-scoped sockets on a
+    single worker. Without pytest-xdist the marks are inert.
+    """
+    for item in items:
+        if item.path.name.startswith(_UDP_MODULES):
+            item.add_marker(pytest.mark.serial)
+            item.add_marker(pytest.mark.xdist_group("udp"))
+
+
+@pytest.fixture(scope="session")
+def zero_key():
+    """All-zero 32-byte HMAC key used by the canonical test vectors."""
+    return b'\x00' * 32
+
+
+@pytest.fixture(scope="session")
+def guid_01():
+    """Canonical 6-byte GUID 010101010101."""
+    return b'\x01' * 6
+
+
+@pytest.fixture(scope="session")
+def canned_packet(zero_key, guid_01):
+    """(Packet, wire bytes) for payload b'test' signed with zero_key."""
+    packet = PacketBuilder.build_packet(guid_01, b'test', zero_key)
+    return packet, packet.to_bytes()
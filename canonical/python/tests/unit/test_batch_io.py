@@ -0,0 +1,134 @@
+"""Unit tests for batched datagram I/O."""
+
+import socket
+import sys
+import time
+import pytest
+from yx.transport import batch_io
+from yx.transport.batch_io import recv_datagrams, send_datagrams
+
+
+@pytest.fixture
+def receiver():
+    """Bound loopback UDP socket on an ephemeral port."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(('127.0.0.1', 0))
+    sock.settimeout(1.0)
+    yield sock
+    sock.close()
+
+
+@pytest.fixture
+def sender():
+    """Unbound UDP socket."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    yield sock
+    sock.close()
+
+
+class TestSendDatagrams:
+    """Test send_datagrams."""
+
+    def test_sends_all_in_order(self, sender, receiver):
+        """Test that every datagram arrives in order."""
+        addr = receiver.getsockname()
+        messages = [(f'datagram {i}'.encode(), addr) for i in range(10)]
+
+        assert send_datagrams(sender, messages) == 10
+
+        assert [receiver.recv(100) for _ in range(10)] == [m for m, _ in messages]
+
+    def test_accepts_bytes_like_data(self, sender, receiver):
+        """Test that bytearray/memoryview payloads are sent intact."""
+        addr = receiver.getsockname()
+        messages = [(bytearray(b'first'), addr), (memoryview(b'second'), addr)]
+
+        send_datagrams(sender, messages)
+
+        assert receiver.recv(100) == b'first'
+        assert receiver.recv(100) == b'second'
+
+    def test_empty_batch(self, sender):
+        """Test that an empty batch sends nothing."""
+        assert send_datagrams(sender, []) == 0
+
+
+@pytest.fixture(params=["native", "fallback"])
+def recv_path(request, monkeypatch):
+    """Run a test through recvmmsg (where available) and the portable loop."""
+    if request.param == "fallback":
+        monkeypatch.setattr(batch_io, "_recvmmsg", None)
+    elif batch_io._recvmmsg is None:
+        pytest.skip("recvmmsg not available")
+    return request.param
+
+
+class TestRecvDatagrams:
+    """Test recv_datagrams batching and fallback."""
+
+    def test_reads_queued_in_order(self, recv_path, sender, receiver):
+        """Test that queued datagrams fill consecutive slots with sender addresses."""
+        addr = receiver.getsockname()
+        for i in range(3):
+            sender.sendto(f'datagram {i}'.encode(), addr)
+        buf = bytearray(100 * 4)
+
+        results = recv_datagrams(receiver, memoryview(buf), 100, 4)
+
+        assert [buf[i * 100:i * 100 + n] for i, (n, _) in enumerate(results)] == [
+            b'datagram 0', b'datagram 1', b'datagram 2'
+        ]
+        assert all(a == ('127.0.0.1', sender.getsockname()[1]) for _, a in results)
+
+    def test_respects_count(self, recv_path, sender, receiver):
+        """Test that at most count datagrams are consumed."""
+        addr = receiver.getsockname()
+        for i in range(4):
+            sender.sendto(f'{i}'.encode(), addr)
+
+        assert len(recv_datagrams(receiver, bytearray(300), 100, 3)) == 3
+        assert receiver.recv(100) == b'3'
+
+    def test_reuses_buffer_across_calls(self, recv_path, sender, receiver):
+        """Test that repeated reads into one buffer each see fresh datagrams."""
+        addr = receiver.getsockname()
+        buf = bytearray(100 * 4)
+
+        for round_ in range(3):
+            for i in range(4):
+                sender.sendto(f'{round_}.{i}'.encode(), addr)
+            results = recv_datagrams(receiver, memoryview(buf), 100, 4)
+            assert [bytes(buf[i * 100:i * 100 + n]) for i, (n, _) in enumerate(results)] == [
+                f'{round_}.{i}'.encode() for i in range(4)
+            ]
+
+    def test_small_reads_skip_recvmmsg(self, sender, receiver, monkeypatch):
+        """Test that reads below MIN_RECV_BATCH use the plain loop."""
+        def fail(*args):
+            raise AssertionError("recvmmsg called")
+
+        monkeypatch.setattr(batch_io, "_recvmmsg", fail)
+        sender.sendto(b'only', receiver.getsockname())
+
+        assert len(recv_datagrams(receiver, bytearray(100), 100, batch_io.MIN_RECV_BATCH - 1)) == 1
+
+    def test_empty_queue_returns_immediately(self, recv_path, receiver):
+        """Test that an empty queue neither waits for the timeout nor changes it."""
+        start = time.monotonic()
+
+        assert recv_datagrams(receiver, bytearray(100), 100, 1) == []
+
+        assert time.monotonic() - start < 0.5
+        assert receiver.gettimeout() == 1.0
+
+    def test_zero_count_reads_nothing(self, recv_path, sender, receiver):
+        """Test that count <= 0 leaves the queue untouched."""
+        sender.sendto(b'kept', receiver.getsockname())
+
+        assert recv_datagrams(receiver, bytearray(100), 100, 0) == []
+        assert receiver.recv(100) == b'kept'
+
+    @pytest.mark.skipif(not sys.platform.startswith('linux'), reason="recvmmsg is Linux-only")
+    def test_recvmmsg_loaded_on_linux(self):
+        """Test that the batched syscall is actually used on Linux."""
+        assert batch_io._recvmmsg is not None
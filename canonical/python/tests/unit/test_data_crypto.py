@@ -4,15 +4,30 @@ Unit tests for data cryptography primitives.
 Implements: specs/testing/testing-strategy.md § Category 3: Unit Tests (Security)
 """
 
+import hashlib
+import hmac
 import pytest
 from yx.primitives import (
     compute_hmac,
     validate_hmac_constant_time,
     compute_packet_hmac,
+    packet_hmac_signer,
     validate_packet_hmac,
+    validate_packet_hmac_raw,
+    clear_hmac_cache,
 )
 
 
+def _diff_bits(a: bytes, b: bytes) -> int:
+    """Count differing bits between two equal-length byte strings."""
+    return (int.from_bytes(a, 'little') ^ int.from_bytes(b, 'little')).bit_count()
+
+
+def _flip_all(mac: bytes) -> bytes:
+    """Return mac with every bit inverted (differs from mac in every byte)."""
+    return (int.from_bytes(mac, 'big') ^ ((1 << (len(mac) * 8)) - 1)).to_bytes(len(mac), 'big')
+
+
 class TestComputeHMAC:
     """Test HMAC computation."""
 
@@ -79,6 +94,76 @@ class TestComputeHMAC:
         assert len(mac) == 16
         assert mac != b'\x00' * 16  # Should not be all zeros
 
+    def test_compute_hmac_prototype_not_mutated(self):
+        """Test that repeated calls with a cached key schedule stay independent."""
+        key = b'\x00' * 32
+        mac1 = compute_hmac(b'first', key)
+        compute_hmac(b'second', key)
+        mac2 = compute_hmac(b'first', key)
+        assert mac1 == mac2
+
+
+class TestHMACCache:
+    """Test HMAC key schedule caching."""
+
+    def test_clear_hmac_cache_preserves_output(self):
+        """Test that clearing the cache does not change HMAC output."""
+        key = b'\x00' * 32
+        mac1 = compute_hmac(b'test', key)
+        clear_hmac_cache()
+        mac2 = compute_hmac(b'test', key)
+        assert mac1 == mac2
+
+    @pytest.mark.parametrize("size", [0, 4, 63, 64, 65, 1400, 5000])
+    def test_matches_stdlib_hmac(self, size):
+        """Test that the cached-pad HMAC equals hmac.new for any data length."""
+        key = bytes(range(32))
+        guid = b'\x01' * 6
+        data = b'x' * size
+        assert compute_hmac(data, key, truncate_to=32) == hmac.new(key, data, hashlib.sha256).digest()
+        assert compute_packet_hmac(guid, data, key) == hmac.new(key, guid + data, hashlib.sha256).digest()[:16]
+
+    def test_pads_for_long_key_match_stdlib(self):
+        """Test RFC 2104 pre-hashing of keys longer than the block size."""
+        from yx.primitives import data_crypto
+
+        key = b'k' * 100
+        inner_pad, outer_pad = data_crypto._hmac_pads(key)
+        inner = inner_pad.copy()
+        inner.update(b'test')
+        outer = outer_pad.copy()
+        outer.update(inner.digest())
+        assert outer.digest() == hmac.new(key, b'test', hashlib.sha256).digest()
+
+    def test_cache_distinguishes_keys(self):
+        """Test that cached schedules are keyed by key value."""
+        data = b'test'
+        mac1 = compute_hmac(data, b'\x00' * 32)
+        mac2 = compute_hmac(data, b'\xff' * 32)
+        mac3 = compute_hmac(data, b'\x00' * 32)
+        assert mac1 != mac2
+        assert mac1 == mac3
+
+    @pytest.mark.parametrize("make_key", [bytearray, memoryview], ids=["bytearray", "memoryview"])
+    def test_bytes_like_key_accepted(self, make_key):
+        """Test that unhashable bytes-like keys still compute and validate."""
+        key = bytes(range(32))
+        guid = b'\x01' * 6
+        mac = compute_packet_hmac(guid, b'test', key)
+
+        assert compute_hmac(b'test', make_key(key)) == compute_hmac(b'test', key)
+        assert compute_packet_hmac(guid, b'test', make_key(key)) == mac
+        assert validate_packet_hmac(guid, b'test', make_key(key), mac) is True
+        assert validate_packet_hmac_raw(mac + guid + b'test', make_key(key)) is True
+
+    def test_mutated_bytearray_key_not_served_stale(self):
+        """Test that changing a bytearray key in place changes the MAC."""
+        key = bytearray(32)
+        mac1 = compute_hmac(b'test', key)
+        key[0] = 0xff
+        assert compute_hmac(b'test', key) == compute_hmac(b'test', bytes(key))
+        assert compute_hmac(b'test', key) != mac1
+
 
 class TestValidateHMAC:
     """Test HMAC validation."""
@@ -95,7 +180,7 @@ class TestValidateHMAC:
         key = b'\x00' * 32
         data = b'test data'
         mac = compute_hmac(data, key)
-        wrong_mac = bytes([(b + 1) % 256 for b in mac])
+        wrong_mac = _flip_all(mac)
         assert validate_hmac_constant_time(data, key, wrong_mac) is False
 
     def test_validate_hmac_modified_data(self):
@@ -125,12 +210,26 @@ class TestValidateHMAC:
         # Valid HMAC
         result1 = validate_hmac_constant_time(data, key, mac)
         # Invalid HMAC (first byte different)
-        wrong_mac = bytes([mac[0] ^ 0xFF]) + mac[1:]
+        wrong_mac = bytearray(mac)
+        wrong_mac[0] ^= 0xFF
+        wrong_mac = bytes(wrong_mac)
         result2 = validate_hmac_constant_time(data, key, wrong_mac)
 
         assert result1 is True
         assert result2 is False
 
+    def test_validate_hmac_wrong_length_skips_hashing(self, monkeypatch):
+        """Test that a wrong-length tag is rejected before computing the HMAC."""
+        from yx.primitives import data_crypto
+
+        def fail(*args):
+            raise AssertionError("HMAC computed for malformed tag")
+
+        monkeypatch.setattr(data_crypto, "compute_hmac", fail)
+        key = b'\x00' * 32
+        assert validate_hmac_constant_time(b'test', key, b'\x00' * 15) is False
+        assert validate_hmac_constant_time(b'test', key, b'') is False
+
 
 class TestComputePacketHMAC:
     """Test packet-specific HMAC computation."""
@@ -173,6 +272,24 @@ class TestComputePacketHMAC:
             compute_packet_hmac(b'\x01' * 5, b'payload', key)
 
 
+class TestPacketHMACSigner:
+    """Test key-bound packet HMAC signer."""
+
+    def test_signer_matches_compute_packet_hmac(self):
+        """Test that signer output equals compute_packet_hmac."""
+        key = b'\x00' * 32
+        guid = b'\x01' * 6
+        sign = packet_hmac_signer(key)
+
+        for payload in (b'', b'test', b'X' * 5000):
+            assert sign(guid, payload) == compute_packet_hmac(guid, payload, key)
+
+    def test_signer_wrong_key_length(self):
+        """Test that non-32-byte key raises ValueError."""
+        with pytest.raises(ValueError, match="Key must be 32 bytes"):
+            packet_hmac_signer(b'short key')
+
+
 class TestValidatePacketHMAC:
     """Test packet HMAC validation."""
 
@@ -191,7 +308,7 @@ class TestValidatePacketHMAC:
         guid = b'\x01' * 6
         payload = b'test'
         mac = compute_packet_hmac(guid, payload, key)
-        wrong_mac = bytes([(b + 1) % 256 for b in mac])
+        wrong_mac = _flip_all(mac)
 
         assert validate_packet_hmac(guid, payload, key, wrong_mac) is False
 
@@ -215,6 +332,19 @@ class TestValidatePacketHMAC:
         modified_payload = b'modified'
         assert validate_packet_hmac(guid, modified_payload, key, mac) is False
 
+    def test_validate_packet_hmac_wrong_length_skips_hashing(self, monkeypatch):
+        """Test that a wrong-length tag is rejected before computing the HMAC."""
+        from yx.primitives import data_crypto
+
+        def fail(*args):
+            raise AssertionError("HMAC computed for malformed tag")
+
+        monkeypatch.setattr(data_crypto, "compute_packet_hmac", fail)
+        key = b'\x00' * 32
+        guid = b'\x01' * 6
+        assert validate_packet_hmac(guid, b'test', key, b'\x00' * 17) is False
+        assert validate_packet_hmac(guid, b'test', key, None) is False
+
 
 class TestHMACSecurityProperties:
     """Test security properties of HMAC implementation."""
@@ -240,7 +370,7 @@ class TestHMACSecurityProperties:
         mac2 = compute_hmac(data2, key)
 
         # Count differing bits
-        diff_bits = sum(bin(b1 ^ b2).count('1') for b1, b2 in zip(mac1, mac2))
+        diff_bits = _diff_bits(mac1, mac2)
 
         # At least 25% of bits should differ (avalanche effect)
         assert diff_bits >= 32  # Out of 128 bits
@@ -255,7 +385,51 @@ class TestHMACSecurityProperties:
         mac2 = compute_hmac(data, key2)
 
         # Count differing bits
-        diff_bits = sum(bin(b1 ^ b2).count('1') for b1, b2 in zip(mac1, mac2))
+        diff_bits = _diff_bits(mac1, mac2)
 
         # At least 25% of bits should differ
         assert diff_bits >= 32
+
+
+class TestValidatePacketHMACRaw:
+    """Test packet HMAC validation over raw wire bytes."""
+
+    def test_validate_raw_valid(self):
+        """Test validating a correctly serialized packet."""
+        key = b'\x00' * 32
+        guid = b'\x01' * 6
+        payload = b'test'
+        mac = compute_packet_hmac(guid, payload, key)
+
+        assert validate_packet_hmac_raw(mac + guid + payload, key) is True
+
+    def test_validate_raw_empty_payload(self):
+        """Test validating a minimum-size packet."""
+        key = b'\x00' * 32
+        guid = b'\x01' * 6
+        mac = compute_packet_hmac(guid, b'', key)
+
+        assert validate_packet_hmac_raw(mac + guid, key) is True
+
+    def test_validate_raw_modified_payload(self):
+        """Test validation fails when payload bytes change."""
+        key = b'\x00' * 32
+        guid = b'\x01' * 6
+        mac = compute_packet_hmac(guid, b'test', key)
+
+        assert validate_packet_hmac_raw(mac + guid + b'tesT', key) is False
+
+    def test_validate_raw_wrong_key(self):
+        """Test validation fails with wrong key."""
+        guid = b'\x01' * 6
+        mac = compute_packet_hmac(guid, b'test', b'\x00' * 32)
+
+        assert validate_packet_hmac_raw(mac + guid + b'test', b'\xff' * 32) is False
+
+    def test_validate_raw_too_short(self):
+        """Test that data shorter than 22 bytes is rejected."""
+        assert validate_packet_hmac_raw(b'\x00' * 21, b'\x00' * 32) is False
+
+    def test_validate_raw_bad_key_length(self):
+        """Test that a non-32-byte key is rejected instead of raising."""
+        assert validate_packet_hmac_raw(b'\x00' * 22, b'short') is False
@@ -4,8 +4,11 @@ Unit tests for GUID Factory.
 Implements: specs/testing/testing-strategy.md § Category 1: Unit Tests
 """
 
+import os
+import threading
 import pytest
 from yx.primitives import GUIDFactory
+from yx.primitives import guid_factory
 
 
 class TestGUIDFactory:
@@ -27,75 +30,108 @@ class TestGUIDFactory:
     def test_generate_uses_secure_random(self):
         """Test that generate() produces non-zero GUIDs (secure random)."""
         # Generate 10 GUIDs and verify at least one has non-zero bytes
-        guids = [GUIDFactory.generate() for _ in range(10)]
+        guids = GUIDFactory.generate_many(10)
         # At least one should have non-zero bytes
         assert any(guid != b'\x00\x00\x00\x00\x00\x00' for guid in guids)
 
-    def test_pad_guid_exact_6_bytes(self):
-        """Test padding when GUID is already 6 bytes."""
-        guid = b'\x01\x02\x03\x04\x05\x06'
+    def test_generate_many(self):
+        """Test that generate_many() returns the requested number of unique GUIDs."""
+        guids = GUIDFactory.generate_many(100)
+        assert len(guids) == 100
+        assert all(isinstance(g, bytes) and len(g) == 6 for g in guids)
+        assert len(set(guids)) == 100
+
+    def test_generate_many_zero(self):
+        """Test that generate_many(0) returns an empty list."""
+        assert GUIDFactory.generate_many(0) == []
+
+    def test_generate_unique_across_pool_refills(self):
+        """Test that GUIDs stay unique when the random pool is refilled."""
+        # 4096-byte pool holds ~682 GUIDs; cross several refills
+        guids = [GUIDFactory.generate() for _ in range(2000)]
+        assert len(set(guids)) == len(guids)
+
+    def test_generate_unique_across_threads(self):
+        """Test that per-thread pools never hand out the same GUID."""
+        results = [[] for _ in range(4)]
+
+        def worker(out):
+            out.extend(GUIDFactory.generate() for _ in range(1000))
+
+        threads = [threading.Thread(target=worker, args=(out,)) for out in results]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        guids = [g for out in results for g in out]
+        assert len(set(guids)) == len(guids)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_generate_not_shared_after_fork(self):
+        """Test that a forked child does not reuse the parent's pooled bytes."""
+        GUIDFactory.generate()  # Ensure the parent pool is populated
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, GUIDFactory.generate())
+            os._exit(0)
+
+        os.close(write_fd)
+        child_guid = os.read(read_fd, 6)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert len(child_guid) == 6
+        assert child_guid != GUIDFactory.generate()
+
+    @pytest.mark.parametrize("guid, expected", [
+        (b'\x01\x02\x03\x04\x05\x06', b'\x01\x02\x03\x04\x05\x06'),
+        (b'\x01\x02', b'\x01\x02\x00\x00\x00\x00'),
+        (b'', b'\x00\x00\x00\x00\x00\x00'),
+        (b'\x01\x02\x03\x04\x05\x06\x07\x08', b'\x01\x02\x03\x04\x05\x06'),
+        (b'\xff', b'\xff\x00\x00\x00\x00\x00'),
+        (b'\x01\x02\x03\x04\x05', b'\x01\x02\x03\x04\x05\x00'),
+    ], ids=["exact", "short", "empty", "long", "one_byte", "five_bytes"])
+    def test_pad_guid(self, guid, expected):
+        """Test padding/truncating GUIDs to exactly 6 bytes."""
         padded = GUIDFactory.pad_guid(guid)
-        assert padded == guid
+        assert padded == expected
         assert len(padded) == 6
 
-    def test_pad_guid_shorter_than_6_bytes(self):
-        """Test padding when GUID is shorter than 6 bytes."""
-        guid = b'\x01\x02'
-        padded = GUIDFactory.pad_guid(guid)
-        assert padded == b'\x01\x02\x00\x00\x00\x00'
-        assert len(padded) == 6
-
-    def test_pad_guid_empty(self):
-        """Test padding empty GUID."""
-        guid = b''
-        padded = GUIDFactory.pad_guid(guid)
-        assert padded == b'\x00\x00\x00\x00\x00\x00'
-        assert len(padded) == 6
-
-    def test_pad_guid_longer_than_6_bytes(self):
-        """Test truncation when GUID is longer than 6 bytes."""
-        guid = b'\x01\x02\x03\x04\x05\x06\x07\x08'
-        padded = GUIDFactory.pad_guid(guid)
-        assert padded == b'\x01\x02\x03\x04\x05\x06'
-        assert len(padded) == 6
-
-    def test_from_hex_valid(self):
-        """Test creating GUID from hex string."""
-        hex_string = "010203040506"
-        guid = GUIDFactory.from_hex(hex_string)
-        assert guid == b'\x01\x02\x03\x04\x05\x06'
-        assert len(guid) == 6
-
-    def test_from_hex_short_string(self):
-        """Test creating GUID from short hex string (should pad)."""
-        hex_string = "0102"
-        guid = GUIDFactory.from_hex(hex_string)
-        assert guid == b'\x01\x02\x00\x00\x00\x00'
-        assert len(guid) == 6
-
-    def test_from_hex_long_string(self):
-        """Test creating GUID from long hex string (should truncate)."""
-        hex_string = "0102030405060708"
+    @pytest.mark.parametrize("hex_string, expected", [
+        ("010203040506", b'\x01\x02\x03\x04\x05\x06'),
+        ("0102", b'\x01\x02\x00\x00\x00\x00'),
+        ("0102030405060708", b'\x01\x02\x03\x04\x05\x06'),
+        ("", b'\x00\x00\x00\x00\x00\x00'),
+    ], ids=["exact", "short", "long", "empty"])
+    def test_from_hex(self, hex_string, expected):
+        """Test creating GUID from hex string (padded or truncated)."""
         guid = GUIDFactory.from_hex(hex_string)
-        assert guid == b'\x01\x02\x03\x04\x05\x06'
+        assert guid == expected
         assert len(guid) == 6
 
-    def test_from_hex_invalid_string(self):
-        """Test that invalid hex string raises ValueError."""
+    @pytest.mark.parametrize("hex_string", [
+        "INVALID",
+        "01020",
+        "010203040506ZZ",
+    ], ids=["not_hex", "odd_length", "invalid_after_12_digits"])
+    def test_from_hex_invalid_raises(self, hex_string):
+        """Test that malformed hex strings raise ValueError."""
         with pytest.raises(ValueError):
-            GUIDFactory.from_hex("INVALID")
-
-    def test_to_hex_valid(self):
+            GUIDFactory.from_hex(hex_string)
+
+    @pytest.mark.parametrize("guid, expected", [
+        (b'\x01\x02\x03\x04\x05\x06', "010203040506"),
+        (b'\x00\x01\x00\x02\x00\x03', "000100020003"),
+        (b'\x00\x00\x00\x00\x00\x00', "000000000000"),
+        (b'\xff\xff\xff\xff\xff\xff', "ffffffffffff"),
+    ], ids=["valid", "with_zeros", "all_zeros", "all_ones"])
+    def test_to_hex(self, guid, expected):
         """Test converting GUID to hex string."""
-        guid = b'\x01\x02\x03\x04\x05\x06'
-        hex_string = GUIDFactory.to_hex(guid)
-        assert hex_string == "010203040506"
-
-    def test_to_hex_with_zeros(self):
-        """Test converting GUID with zeros to hex string."""
-        guid = b'\x00\x01\x00\x02\x00\x03'
-        hex_string = GUIDFactory.to_hex(guid)
-        assert hex_string == "000100020003"
+        assert GUIDFactory.to_hex(guid) == expected
 
     def test_hex_roundtrip(self):
         """Test converting GUID to hex and back."""
@@ -109,31 +145,11 @@ class TestGUIDFactory:
 class TestGUIDFactoryEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_pad_guid_one_byte(self):
-        """Test padding 1-byte GUID."""
-        guid = b'\xff'
-        padded = GUIDFactory.pad_guid(guid)
-        assert padded == b'\xff\x00\x00\x00\x00\x00'
-
-    def test_pad_guid_five_bytes(self):
-        """Test padding 5-byte GUID."""
-        guid = b'\x01\x02\x03\x04\x05'
-        padded = GUIDFactory.pad_guid(guid)
-        assert padded == b'\x01\x02\x03\x04\x05\x00'
-
-    def test_from_hex_empty_string(self):
-        """Test creating GUID from empty hex string."""
-        guid = GUIDFactory.from_hex("")
-        assert guid == b'\x00\x00\x00\x00\x00\x00'
-
-    def test_to_hex_all_zeros(self):
-        """Test converting all-zeros GUID to hex."""
-        guid = b'\x00\x00\x00\x00\x00\x00'
-        hex_string = GUIDFactory.to_hex(guid)
-        assert hex_string == "000000000000"
-
-    def test_to_hex_all_ones(self):
-        """Test converting all-0xFF GUID to hex."""
-        guid = b'\xff\xff\xff\xff\xff\xff'
-        hex_string = GUIDFactory.to_hex(guid)
-        assert hex_string == "ffffffffffff"
+    def test_module_functions_match_class_namespace(self):
+        """Test that module-level functions back the GUIDFactory methods."""
+        assert GUIDFactory.generate is guid_factory.generate
+        assert GUIDFactory.generate_many is guid_factory.generate_many
+        assert GUIDFactory.pad_guid is guid_factory.pad_guid
+        assert GUIDFactory.from_hex is guid_factory.from_hex
+        assert GUIDFactory.to_hex is guid_factory.to_hex
+        assert guid_factory.pad_guid(b'\x01') == GUIDFactory.pad_guid(b'\x01')
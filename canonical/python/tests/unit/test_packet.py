@@ -4,6 +4,8 @@ Unit tests for Packet data structure.
 Implements: specs/testing/testing-strategy.md § Category 1: Unit Tests
 """
 
+import dataclasses
+import pickle
 import pytest
 from yx.transport import Packet
 
@@ -59,6 +61,17 @@ class TestPacketCreation:
         with pytest.raises(TypeError, match="payload must be bytes"):
             Packet(hmac=b'\x00' * 16, guid=b'\x01' * 6, payload="not bytes")
 
+    def test_packet_is_immutable(self):
+        """Test that packet fields cannot be reassigned."""
+        packet = Packet(hmac=b'\x00' * 16, guid=b'\x01' * 6, payload=b'test')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            packet.payload = b'other'
+
+    def test_packet_has_no_instance_dict(self):
+        """Test that packet uses __slots__ instead of a per-instance dict."""
+        packet = Packet(hmac=b'\x00' * 16, guid=b'\x01' * 6, payload=b'')
+        assert not hasattr(packet, '__dict__')
+
 
 class TestPacketSerialization:
     """Test Packet serialization (to_bytes)."""
@@ -103,6 +116,37 @@ class TestPacketSerialization:
         assert len(data) == 10022
         assert data[22:] == payload
 
+    def test_to_bytes_cached(self):
+        """Test that repeated to_bytes() returns the same serialized object."""
+        packet = Packet(hmac=b'\x00' * 16, guid=b'\x01' * 6, payload=b'test')
+        assert packet.to_bytes() is packet.to_bytes()
+
+    def test_to_bytes_cached_for_parsed_packet(self):
+        """Test caching on packets built without __init__ (from_bytes)."""
+        data = b'\x00' * 16 + b'\x01' * 6 + b'test'
+        packet = Packet.from_bytes(data)
+        assert packet.to_bytes() == data
+        assert packet.to_bytes() is packet.to_bytes()
+
+    def test_cache_ignored_by_eq_and_hash(self):
+        """Test that a populated cache does not affect equality or hashing."""
+        a = Packet(hmac=b'\x00' * 16, guid=b'\x01' * 6, payload=b'test')
+        b = Packet(hmac=b'\x00' * 16, guid=b'\x01' * 6, payload=b'test')
+        a.to_bytes()
+        assert a == b
+        assert hash(a) == hash(b)
+
+    def test_cache_not_a_dataclass_field(self):
+        """Test that fields(), asdict() and astuple() see only the wire fields."""
+        packet = Packet(hmac=b'\x00' * 16, guid=b'\x01' * 6, payload=b'test')
+        packet.to_bytes()
+
+        assert [f.name for f in dataclasses.fields(packet)] == ['hmac', 'guid', 'payload']
+        assert dataclasses.asdict(packet) == {
+            'hmac': b'\x00' * 16, 'guid': b'\x01' * 6, 'payload': b'test'
+        }
+        assert dataclasses.astuple(packet) == (b'\x00' * 16, b'\x01' * 6, b'test')
+
 
 class TestPacketDeserialization:
     """Test Packet deserialization (from_bytes)."""
@@ -160,6 +204,53 @@ class TestPacketDeserialization:
         packet = Packet.from_bytes(data)
         assert packet is not None  # Should work with valid data
 
+    def test_from_bytes_non_bytes_returns_none(self):
+        """Test that non-bytes-like input is rejected."""
+        assert Packet.from_bytes('x' * 30) is None
+
+    def test_from_bytes_fields_are_bytes(self):
+        """Test that parsed fields are bytes even for bytearray input."""
+        data = bytearray(b'\x01' * 16 + b'\x02' * 6 + b'test')
+
+        packet = Packet.from_bytes(data)
+
+        assert isinstance(packet.guid, bytes)
+        assert isinstance(packet.payload, bytes)
+        assert packet.payload == b'test'
+
+    def test_from_bytes_memoryview_slice(self):
+        """Test parsing a memoryview over part of a larger receive buffer."""
+        buffer = bytearray(b'\x01' * 16 + b'\x02' * 6 + b'test' + b'\xff' * 100)
+
+        packet = Packet.from_bytes(memoryview(buffer)[:26])
+
+        assert packet.hmac == b'\x01' * 16
+        assert packet.guid == b'\x02' * 6
+        assert packet.payload == b'test'
+        buffer[22:26] = b'XXXX'  # Fields must not alias the buffer
+        assert packet.payload == b'test'
+
+    def test_from_validated_bytes(self):
+        """Test trusted deserialization splits fields at fixed offsets."""
+        data = b'\x01' * 16 + b'\x02' * 6 + b'test payload'
+
+        packet = Packet.from_validated_bytes(data)
+
+        assert packet.hmac == b'\x01' * 16
+        assert packet.guid == b'\x02' * 6
+        assert packet.payload == b'test payload'
+
+    def test_from_validated_bytes_normalizes_to_bytes(self):
+        """Test that bytearray input still yields bytes fields."""
+        data = bytearray(b'\x01' * 16 + b'\x02' * 6 + b'test')
+
+        packet = Packet.from_validated_bytes(data)
+
+        assert isinstance(packet.hmac, bytes)
+        assert isinstance(packet.guid, bytes)
+        assert isinstance(packet.payload, bytes)
+        assert packet == Packet.from_bytes(bytes(data))
+
 
 class TestPacketRoundtrip:
     """Test serialization/deserialization roundtrip."""
@@ -174,6 +265,7 @@ class TestPacketRoundtrip:
         assert restored.hmac == original.hmac
         assert restored.guid == original.guid
         assert restored.payload == original.payload
+        assert restored.to_bytes() == original.to_bytes()
 
     def test_roundtrip_with_payload(self):
         """Test roundtrip with payload."""
@@ -189,6 +281,7 @@ class TestPacketRoundtrip:
         assert restored.hmac == original.hmac
         assert restored.guid == original.guid
         assert restored.payload == original.payload
+        assert restored.to_bytes() == original.to_bytes()
 
     def test_roundtrip_large_payload(self):
         """Test roundtrip with large payload."""
@@ -204,6 +297,7 @@ class TestPacketRoundtrip:
         assert restored.hmac == original.hmac
         assert restored.guid == original.guid
         assert restored.payload == original.payload
+        assert restored.to_bytes() == original.to_bytes()
 
 
 class TestPacketUtilities:
@@ -229,3 +323,23 @@ class TestPacketUtilities:
         assert 'payload=' in repr_str
         assert 'bbbbbbbbbbbb' in repr_str  # GUID in hex
         assert '4B' in repr_str  # Payload size
+
+    def test_repr_hmac_prefix(self):
+        """Test __repr__ shows only the leading HMAC bytes."""
+        packet = Packet(hmac=b'\x01\x02\x03\x04' + b'\xff' * 12, guid=b'\xbb' * 6, payload=b'')
+        repr_str = repr(packet)
+        assert 'hmac=01020304...' in repr_str
+        assert 'ff' not in repr_str
+
+    def test_pickle_roundtrip_omits_cache(self):
+        """Test that pickling keeps the fields but not the to_bytes() cache."""
+        packet = Packet(hmac=b'\xaa' * 16, guid=b'\xbb' * 6, payload=b'x' * 1000)
+        fresh_size = len(pickle.dumps(packet))
+        packet.to_bytes()
+
+        data = pickle.dumps(packet)
+        restored = pickle.loads(data)
+
+        assert len(data) == fresh_size
+        assert restored == packet
+        assert restored.to_bytes() == packet.to_bytes()
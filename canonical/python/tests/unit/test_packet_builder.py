@@ -12,185 +12,171 @@ from yx.primitives import validate_packet_hmac
 class TestBuildPacket:
     """Test packet building with HMAC computation."""
 
-    def test_build_packet_basic(self):
+    def test_build_packet_basic(self, zero_key, guid_01):
         """Test building a basic packet."""
-        key = b'\x00' * 32
-        guid = b'\x01' * 6
         payload = b'test payload'
 
-        packet = PacketBuilder.build_packet(guid, payload, key)
+        packet = PacketBuilder.build_packet(guid_01, payload, zero_key)
 
         assert isinstance(packet, Packet)
-        assert packet.guid == guid
+        assert packet.guid == guid_01
         assert packet.payload == payload
         assert len(packet.hmac) == 16
 
-    def test_build_packet_hmac_valid(self):
+    def test_build_packet_hmac_valid(self, zero_key, guid_01):
         """Test that built packet has valid HMAC."""
-        key = b'\x00' * 32
-        guid = b'\x01' * 6
         payload = b'test'
 
-        packet = PacketBuilder.build_packet(guid, payload, key)
+        packet = PacketBuilder.build_packet(guid_01, payload, zero_key)
 
         # Verify HMAC is valid
-        is_valid = validate_packet_hmac(packet.guid, packet.payload, key, packet.hmac)
+        is_valid = validate_packet_hmac(packet.guid, packet.payload, zero_key, packet.hmac)
         assert is_valid is True
 
-    def test_build_packet_pads_short_guid(self):
+    def test_build_packet_pads_short_guid(self, zero_key):
         """Test that short GUID is padded."""
-        key = b'\x00' * 32
         guid = b'\x01\x02'  # Only 2 bytes
         payload = b'test'
 
-        packet = PacketBuilder.build_packet(guid, payload, key)
+        packet = PacketBuilder.build_packet(guid, payload, zero_key)
 
         assert len(packet.guid) == 6
         assert packet.guid == b'\x01\x02\x00\x00\x00\x00'
 
-    def test_build_packet_truncates_long_guid(self):
+    def test_build_packet_truncates_long_guid(self, zero_key):
         """Test that long GUID is truncated."""
-        key = b'\x00' * 32
         guid = b'\x01' * 8  # 8 bytes
         payload = b'test'
 
-        packet = PacketBuilder.build_packet(guid, payload, key)
+        packet = PacketBuilder.build_packet(guid, payload, zero_key)
 
         assert len(packet.guid) == 6
         assert packet.guid == b'\x01' * 6
 
-    def test_build_packet_empty_payload(self):
+    def test_build_packet_empty_payload(self, zero_key, guid_01):
         """Test building packet with empty payload."""
-        key = b'\x00' * 32
-        guid = b'\x01' * 6
         payload = b''
 
-        packet = PacketBuilder.build_packet(guid, payload, key)
+        packet = PacketBuilder.build_packet(guid_01, payload, zero_key)
 
         assert packet.payload == b''
         assert len(packet) == 22  # Minimum size
 
-    def test_build_packet_different_guids_different_hmac(self):
-        """Test that different GUIDs produce different HMACs."""
-        key = b'\x00' * 32
-        payload = b'test'
-
-        packet1 = PacketBuilder.build_packet(b'\x01' * 6, payload, key)
-        packet2 = PacketBuilder.build_packet(b'\x02' * 6, payload, key)
-
-        assert packet1.hmac != packet2.hmac
-
-    def test_build_packet_different_payloads_different_hmac(self):
-        """Test that different payloads produce different HMACs."""
-        key = b'\x00' * 32
-        guid = b'\x01' * 6
-
-        packet1 = PacketBuilder.build_packet(guid, b'payload1', key)
-        packet2 = PacketBuilder.build_packet(guid, b'payload2', key)
+    @pytest.mark.parametrize("inputs_a, inputs_b", [
+        ((b'\x01' * 6, b'test', b'\x00' * 32), (b'\x02' * 6, b'test', b'\x00' * 32)),
+        ((b'\x01' * 6, b'payload1', b'\x00' * 32), (b'\x01' * 6, b'payload2', b'\x00' * 32)),
+        ((b'\x01' * 6, b'test', b'\x00' * 32), (b'\x01' * 6, b'test', b'\xff' * 32)),
+    ], ids=["guid", "payload", "key"])
+    def test_build_packet_different_input_different_hmac(self, inputs_a, inputs_b):
+        """Test that changing the GUID, payload or key changes the HMAC."""
+        packet1 = PacketBuilder.build_packet(*inputs_a)
+        packet2 = PacketBuilder.build_packet(*inputs_b)
 
         assert packet1.hmac != packet2.hmac
 
-    def test_build_packet_different_keys_different_hmac(self):
-        """Test that different keys produce different HMACs."""
-        guid = b'\x01' * 6
-        payload = b'test'
-
-        packet1 = PacketBuilder.build_packet(guid, payload, b'\x00' * 32)
-        packet2 = PacketBuilder.build_packet(guid, payload, b'\xff' * 32)
-
-        assert packet1.hmac != packet2.hmac
-
-    def test_build_packet_deterministic(self):
+    def test_build_packet_deterministic(self, zero_key, guid_01):
         """Test that building is deterministic."""
-        key = b'\x00' * 32
-        guid = b'\x01' * 6
         payload = b'test'
 
-        packet1 = PacketBuilder.build_packet(guid, payload, key)
-        packet2 = PacketBuilder.build_packet(guid, payload, key)
+        packet1 = PacketBuilder.build_packet(guid_01, payload, zero_key)
+        packet2 = PacketBuilder.build_packet(guid_01, payload, zero_key)
 
         assert packet1.hmac == packet2.hmac
         assert packet1.guid == packet2.guid
         assert packet1.payload == packet2.payload
 
+    @pytest.mark.parametrize("guid, payload, message", [
+        (bytearray(b'\x01' * 6), b'test', "guid must be bytes"),
+        (bytearray(b'\x01' * 2), b'test', "guid must be bytes"),
+        (b'\x01' * 6, bytearray(b'test'), "payload must be bytes"),
+    ], ids=["bytearray_guid", "short_bytearray_guid", "bytearray_payload"])
+    def test_build_packet_rejects_mutable_inputs(self, zero_key, guid, payload, message):
+        """Test that bytearray inputs raise TypeError instead of yielding a mutable Packet."""
+        with pytest.raises(TypeError, match=message):
+            PacketBuilder.build_packet(guid, payload, zero_key)
+
 
 class TestBuildAndSerialize:
     """Test combined build and serialization."""
 
-    def test_build_and_serialize_basic(self):
+    def test_build_and_serialize_basic(self, zero_key, guid_01):
         """Test building and serializing in one step."""
-        key = b'\x00' * 32
-        guid = b'\x01' * 6
         payload = b'test'
 
-        data = PacketBuilder.build_and_serialize(guid, payload, key)
+        data = PacketBuilder.build_and_serialize(guid_01, payload, zero_key)
 
         assert isinstance(data, bytes)
         assert len(data) == 26  # 16 + 6 + 4
 
-    def test_build_and_serialize_matches_separate_steps(self):
+    def test_build_and_serialize_matches_separate_steps(self, zero_key, guid_01):
         """Test that combined method matches separate build + serialize."""
-        key = b'\x00' * 32
-        guid = b'\x01' * 6
         payload = b'test'
 
         # Combined method
-        data1 = PacketBuilder.build_and_serialize(guid, payload, key)
+        data1 = PacketBuilder.build_and_serialize(guid_01, payload, zero_key)
 
         # Separate steps
-        packet = PacketBuilder.build_packet(guid, payload, key)
+        packet = PacketBuilder.build_packet(guid_01, payload, zero_key)
         data2 = packet.to_bytes()
 
         assert data1 == data2
 
-    def test_build_and_serialize_can_be_parsed(self):
+    @pytest.mark.parametrize("build", [
+        PacketBuilder.build_packet,
+        PacketBuilder.build_and_serialize,
+    ], ids=["build_packet", "build_and_serialize"])
+    @pytest.mark.parametrize("guid,payload,message", [
+        (bytearray(b'\x01' * 6), b'test', "guid must be bytes"),
+        (memoryview(b'\x01' * 6), b'test', "guid must be bytes"),
+        (b'\x01' * 6, bytearray(b'test'), "payload must be bytes"),
+        (b'\x01' * 6, memoryview(b'test'), "payload must be bytes"),
+    ], ids=["bytearray_guid", "memoryview_guid", "bytearray_payload", "memoryview_payload"])
+    def test_both_builders_reject_non_bytes(self, zero_key, build, guid, payload, message):
+        """Test that both build paths reject the same non-bytes inputs."""
+        with pytest.raises(TypeError, match=message):
+            build(guid, payload, zero_key)
+
+    def test_build_and_serialize_can_be_parsed(self, zero_key, guid_01):
         """Test that serialized data can be parsed back."""
-        key = b'\x00' * 32
-        guid = b'\x01' * 6
         payload = b'test payload'
 
-        data = PacketBuilder.build_and_serialize(guid, payload, key)
+        data = PacketBuilder.build_and_serialize(guid_01, payload, zero_key)
         packet = Packet.from_bytes(data)
 
         assert packet is not None
-        assert packet.guid == guid
+        assert packet.guid == guid_01
         assert packet.payload == payload
 
-    def test_build_and_serialize_hmac_valid(self):
+    def test_build_and_serialize_hmac_valid(self, zero_key, guid_01):
         """Test that serialized packet has valid HMAC."""
-        key = b'\x00' * 32
-        guid = b'\x01' * 6
         payload = b'test'
 
-        data = PacketBuilder.build_and_serialize(guid, payload, key)
+        data = PacketBuilder.build_and_serialize(guid_01, payload, zero_key)
         packet = Packet.from_bytes(data)
 
         assert packet is not None
-        is_valid = validate_packet_hmac(packet.guid, packet.payload, key, packet.hmac)
+        is_valid = validate_packet_hmac(packet.guid, packet.payload, zero_key, packet.hmac)
         assert is_valid is True
 
 
 class TestPacketBuilderEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_build_packet_large_payload(self):
+    def test_build_packet_large_payload(self, zero_key, guid_01):
         """Test building packet with large payload."""
-        key = b'\x00' * 32
-        guid = b'\x01' * 6
         payload = b'X' * 10000
 
-        packet = PacketBuilder.build_packet(guid, payload, key)
+        packet = PacketBuilder.build_packet(guid_01, payload, zero_key)
 
         assert len(packet.payload) == 10000
-        assert validate_packet_hmac(packet.guid, packet.payload, key, packet.hmac)
+        assert validate_packet_hmac(packet.guid, packet.payload, zero_key, packet.hmac)
 
-    def test_build_packet_all_zeros(self):
+    def test_build_packet_all_zeros(self, zero_key):
         """Test building packet with all-zero data."""
-        key = b'\x00' * 32
         guid = b'\x00' * 6
         payload = b'\x00' * 100
 
-        packet = PacketBuilder.build_packet(guid, payload, key)
+        packet = PacketBuilder.build_packet(guid, payload, zero_key)
 
         # HMAC should not be all zeros
         assert packet.hmac != b'\x00' * 16
@@ -1,16 +1,16 @@
 """Unit tests for Packet Parser and Validator."""
 
 import pytest
+from yx.primitives import compute_packet_hmac
 from yx.transport import PacketBuilder, Packet
 
 
 class TestParsePacket:
     """Test packet parsing (no validation)."""
 
-    def test_parse_valid_packet(self):
+    def test_parse_valid_packet(self, canned_packet):
         """Test parsing valid packet."""
-        key = b'\x00' * 32
-        data = PacketBuilder.build_and_serialize(b'\x01'*6, b'test', key)
+        _, data = canned_packet
 
         packet = PacketBuilder.parse_packet(data)
 
@@ -26,65 +26,63 @@ class TestParsePacket:
 class TestValidateHMAC:
     """Test HMAC validation."""
 
-    def test_validate_hmac_valid_packet(self):
+    def test_validate_hmac_valid_packet(self, zero_key, canned_packet):
         """Test validating packet with correct HMAC."""
-        key = b'\x00' * 32
-        packet = PacketBuilder.build_packet(b'\x01'*6, b'test', key)
+        packet, _ = canned_packet
 
-        assert PacketBuilder.validate_hmac(packet, key) is True
+        assert PacketBuilder.validate_hmac(packet, zero_key) is True
 
-    def test_validate_hmac_invalid_packet(self):
+    def test_validate_hmac_invalid_packet(self, zero_key, guid_01):
         """Test validation fails with wrong HMAC."""
-        key = b'\x00' * 32
-        packet = Packet(hmac=b'\xff'*16, guid=b'\x01'*6, payload=b'test')
+        packet = Packet(hmac=b'\xff'*16, guid=guid_01, payload=b'test')
 
-        assert PacketBuilder.validate_hmac(packet, key) is False
+        assert PacketBuilder.validate_hmac(packet, zero_key) is False
 
 
 class TestParseAndValidate:
     """Test combined parsing and validation."""
 
-    def test_parse_and_validate_valid_packet(self):
+    def test_parse_and_validate_valid_packet(self, zero_key, canned_packet):
         """Test parsing and validating valid packet."""
-        key = b'\x00' * 32
-        data = PacketBuilder.build_and_serialize(b'\x01'*6, b'test', key)
+        _, data = canned_packet
 
-        packet = PacketBuilder.parse_and_validate(data, key)
+        packet = PacketBuilder.parse_and_validate(data, zero_key)
 
         assert packet is not None
         assert packet.payload == b'test'
 
-    def test_parse_and_validate_invalid_hmac(self):
+    def test_parse_and_validate_invalid_hmac(self, zero_key, guid_01):
         """Test that invalid HMAC returns None."""
-        key = b'\x00' * 32
         # Build with one key, validate with another
-        data = PacketBuilder.build_and_serialize(b'\x01'*6, b'test', b'\xff'*32)
+        data = PacketBuilder.build_and_serialize(guid_01, b'test', b'\xff'*32)
 
-        packet = PacketBuilder.parse_and_validate(data, key)
+        packet = PacketBuilder.parse_and_validate(data, zero_key)
 
         assert packet is None
 
-    def test_parse_and_validate_corrupted_data(self):
+    def test_parse_and_validate_corrupted_data(self, zero_key, canned_packet):
         """Test handling corrupted packet."""
-        key = b'\x00' * 32
-        data = PacketBuilder.build_and_serialize(b'\x01'*6, b'test', key)
+        _, data = canned_packet
 
         # Corrupt one byte in payload
-        corrupted = data[:23] + bytes([(data[23] ^ 0xFF)]) + data[24:]
+        corrupted = bytearray(data)
+        corrupted[23] ^= 0xFF
+        corrupted = bytes(corrupted)
 
-        packet = PacketBuilder.parse_and_validate(corrupted, key)
+        packet = PacketBuilder.parse_and_validate(corrupted, zero_key)
 
         assert packet is None  # HMAC validation fails
 
-    def test_parse_and_validate_roundtrip(self):
+    def test_parse_and_validate_roundtrip(self, zero_key):
         """Test full roundtrip: build → serialize → parse → validate."""
-        key = b'\x00' * 32
         guid = b'\xaa' * 6
         payload = b'test payload data'
 
-        data = PacketBuilder.build_and_serialize(guid, payload, key)
-        packet = PacketBuilder.parse_and_validate(data, key)
+        data = PacketBuilder.build_and_serialize(guid, payload, zero_key)
+        packet = PacketBuilder.parse_and_validate(data, zero_key)
 
         assert packet is not None
+        assert packet.hmac == compute_packet_hmac(guid, payload, zero_key)
         assert packet.guid == guid
         assert packet.payload == payload
+        assert packet.to_bytes() == data
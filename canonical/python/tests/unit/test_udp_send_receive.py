@@ -1,37 +1,63 @@
 """Test UDP send/receive."""
 
 import socket
+import threading
+import time
 import pytest
-from yx.transport import UDPSocket
+from yx.transport import PacketBuilder, UDPSocket
+from yx.transport import udp_socket
+
+
+@pytest.fixture(scope="module")
+def udp_pair():
+    """Sender and receiver on ephemeral loopback ports, shared by the module."""
+    receiver = UDPSocket(port=0)
+    receiver.bind()
+    receiver.socket.settimeout(1.0)
+
+    sender = UDPSocket(port=0)
+    sender.bind()
+
+    yield sender, receiver, receiver.socket.getsockname()[1]
+
+    sender.close()
+    receiver.close()
+
+
+@pytest.fixture(autouse=True)
+def _drain_receiver(udp_pair):
+    """Discard datagrams a test left queued so the next test starts clean."""
+    yield
+    receiver = udp_pair[1].socket
+    receiver.setblocking(False)
+    try:
+        while True:
+            receiver.recv(65535)
+    except BlockingIOError:
+        pass
+    finally:
+        receiver.settimeout(1.0)
 
 
 class TestUDPSendReceive:
     """Test send/receive functionality."""
 
-    def test_send_packet(self):
+    def test_send_packet(self, udp_pair):
         """Test sending packet."""
         key = b'\x00' * 32
-        sender = UDPSocket(port=0)  # Random port
-        sender.bind()
+        sender, _, port = udp_pair
 
         # Should not raise
-        sender.send_packet(b'\x01'*6, b'test', key, '127.0.0.1', 50010)
+        sender.send_packet(b'\x01'*6, b'test', key, '127.0.0.1', port)
 
-        sender.close()
-
-    def test_send_receive_loopback(self):
+    def test_send_receive_loopback(self, udp_pair):
         """Test sending and receiving on same machine."""
         key = b'\x00' * 32
 
-        receiver = UDPSocket(port=50011)
-        receiver.bind()
-        receiver.socket.settimeout(1.0)
-
-        sender = UDPSocket(port=0)
-        sender.bind()
+        sender, receiver, port = udp_pair
 
         # Send
-        sender.send_packet(b'\x01'*6, b'test payload', key, '127.0.0.1', 50011)
+        sender.send_packet(b'\x01'*6, b'test payload', key, '127.0.0.1', port)
 
         # Receive
         guid, payload, addr = receiver.receive_packet(key)
@@ -39,5 +65,200 @@ class TestUDPSendReceive:
         assert guid == b'\x01' * 6
         assert payload == b'test payload'
 
-        sender.close()
-        receiver.close()
+    def test_send_reuses_cached_key_and_guid(self, udp_pair):
+        """Test consecutive sends with changing key/GUID stay valid."""
+        key1 = b'\x00' * 32
+        key2 = b'\xff' * 32
+
+        sender, receiver, port = udp_pair
+
+        sender.send_packet(b'\x01'*6, b'first', key1, '127.0.0.1', port)
+        sender.send_packet(b'\x01'*6, b'second', key1, '127.0.0.1', port)
+        sender.send_packet(b'\x02', b'third', key2, '127.0.0.1', port)
+
+        assert receiver.receive_packet(key1)[:2] == (b'\x01' * 6, b'first')
+        assert receiver.receive_packet(key1)[:2] == (b'\x01' * 6, b'second')
+        assert receiver.receive_packet(key2)[:2] == (b'\x02' + b'\x00' * 5, b'third')
+
+    def test_send_sees_in_place_mutation_of_guid_and_key(self, udp_pair):
+        """Test that a bytearray GUID/key changed between sends is not served stale."""
+        guid = bytearray(b'\x01' * 6)
+        key = bytearray(32)
+
+        sender, receiver, port = udp_pair
+
+        sender.send_packet(guid, b'first', key, '127.0.0.1', port)
+        guid[:] = b'\x02' * 6
+        key[:] = b'\xff' * 32
+        sender.send_packet(guid, b'second', key, '127.0.0.1', port)
+
+        assert receiver.receive_packet(b'\x00' * 32)[:2] == (b'\x01' * 6, b'first')
+        assert receiver.receive_packet(b'\xff' * 32)[:2] == (b'\x02' * 6, b'second')
+
+    def test_send_cache_consistent_across_threads(self, monkeypatch):
+        """Test that threads sending with different keys/GUIDs never mix them up."""
+        signer_for = udp_socket.packet_hmac_signer
+        pad = udp_socket.pad_guid
+
+        def slow_signer(key):
+            # Simulate preemption while the cache is being refreshed
+            time.sleep(0.0001)
+            return signer_for(key)
+
+        def slow_pad(guid):
+            time.sleep(0.0001)
+            return pad(guid)
+
+        monkeypatch.setattr(udp_socket, "packet_hmac_signer", slow_signer)
+        monkeypatch.setattr(udp_socket, "pad_guid", slow_pad)
+
+        sender = UDPSocket(port=0)
+        mismatches = []
+
+        def serialize(guid, key):
+            for _ in range(300):
+                packet = PacketBuilder.parse_and_validate(sender._serialize(guid, b'data', key), key)
+                if packet is None or packet.guid != guid:
+                    mismatches.append(guid)
+
+        threads = [
+            threading.Thread(target=serialize, args=(b'\x01' * 6, b'\x00' * 32)),
+            threading.Thread(target=serialize, args=(b'\x02' * 6, b'\xff' * 32)),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert not mismatches
+
+    def test_receive_packets_batch(self, udp_pair):
+        """Test draining several queued packets in one call."""
+        key = b'\x00' * 32
+
+        sender, receiver, port = udp_pair
+
+        for i in range(3):
+            sender.send_packet(b'\x01'*6, f'packet {i}'.encode(), key, '127.0.0.1', port)
+        # Wrong key: dropped from the batch
+        sender.send_packet(b'\x01'*6, b'forgery', b'\xff' * 32, '127.0.0.1', port)
+
+        packets = receiver.receive_packets(key)
+
+        assert [payload for _, payload, _ in packets] == [b'packet 0', b'packet 1', b'packet 2']
+        assert all(guid == b'\x01' * 6 for guid, _, _ in packets)
+        # Draining never changes the socket's timeout
+        assert receiver.socket.gettimeout() == 1.0
+
+    def test_receive_packets_respects_max_packets(self, udp_pair):
+        """Test that at most max_packets datagrams are read per call."""
+        key = b'\x00' * 32
+
+        sender, receiver, port = udp_pair
+
+        for i in range(3):
+            sender.send_packet(b'\x01'*6, f'packet {i}'.encode(), key, '127.0.0.1', port)
+
+        first = receiver.receive_packets(key, max_packets=2)
+        second = receiver.receive_packets(key, max_packets=2)
+
+        assert len(first) == 2
+        assert [payload for _, payload, _ in second] == [b'packet 2']
+
+    @pytest.mark.parametrize("max_packets", [0, -1])
+    def test_receive_packets_nonpositive_max_reads_nothing(self, udp_pair, max_packets):
+        """Test that max_packets <= 0 returns at once and leaves the queue intact."""
+        key = b'\x00' * 32
+
+        sender, receiver, port = udp_pair
+        sender.send_packet(b'\x01'*6, b'kept', key, '127.0.0.1', port)
+
+        assert receiver.receive_packets(key, max_packets=max_packets) == []
+        assert receiver.receive_packet(key)[1] == b'kept'
+
+    def test_receive_packets_two_threads_never_accept_forged(self, monkeypatch):
+        """Test that a datagram read by one thread cannot replace one another thread validated."""
+        key = b'\x00' * 32
+        validate = udp_socket.validate_packet_hmac_raw
+
+        def validate_then_yield(data, k):
+            # Simulate preemption between authentication and copy-out
+            ok = validate(data, k)
+            time.sleep(0.0005)
+            return ok
+
+        monkeypatch.setattr(udp_socket, "validate_packet_hmac_raw", validate_then_yield)
+
+        receiver = UDPSocket(port=0)
+        receiver.bind()
+        receiver.socket.settimeout(0.3)
+        sender = UDPSocket(port=0)
+        port = receiver.socket.getsockname()[1]
+        accepted = []
+
+        def drain():
+            try:
+                while True:
+                    accepted.extend(p for _, p, _ in receiver.receive_packets(key, max_packets=4))
+            except socket.timeout:
+                pass
+
+        threads = [threading.Thread(target=drain) for _ in range(2)]
+        try:
+            for t in threads:
+                t.start()
+            for i in range(200):
+                if i % 2:
+                    sender.send_packet(b'\x01'*6, b'forgery', b'\xff' * 32, '127.0.0.1', port)
+                else:
+                    sender.send_packet(b'\x01'*6, b'genuine', key, '127.0.0.1', port)
+            for t in threads:
+                t.join()
+        finally:
+            sender.close()
+            receiver.close()
+
+        assert b'forgery' not in accepted
+        assert accepted  # both threads actually received
+
+    def test_send_packets_batch(self, udp_pair):
+        """Test sending a burst of packets in one call."""
+        key = b'\x00' * 32
+
+        sender, receiver, port = udp_pair
+
+        packets = [
+            (b'\x01'*6, f'packet {i}'.encode(), ('127.0.0.1', port))
+            for i in range(5)
+        ]
+        assert sender.send_packets(packets, key) == 5
+
+        received = [receiver.receive_packet(key)[1] for _ in range(5)]
+        assert received == [f'packet {i}'.encode() for i in range(5)]
+
+    def test_send_packets_hostname_destination(self, udp_pair):
+        """Test that hostname destinations are resolved (or fall back to sendto)."""
+        key = b'\x00' * 32
+
+        sender, receiver, port = udp_pair
+
+        packets = [(b'\x01'*6, b'a', ('localhost', port)), (b'\x01'*6, b'b', ('localhost', port))]
+        sender.send_packets(packets, key)
+
+        assert receiver.receive_packet(key)[1] == b'a'
+        assert receiver.receive_packet(key)[1] == b'b'
+
+    def test_send_many_prebuilt(self, udp_pair):
+        """Test sending already-serialized packets in one call."""
+        key = b'\x00' * 32
+
+        sender, receiver, port = udp_pair
+
+        datagrams = [
+            (PacketBuilder.build_and_serialize(b'\x01'*6, f'packet {i}'.encode(), key), ('127.0.0.1', port))
+            for i in range(4)
+        ]
+        assert sender.send_many(datagrams) == 4
+
+        received = [receiver.receive_packet(key)[1] for _ in range(4)]
+        assert received == [f'packet {i}'.encode() for i in range(4)]
@@ -1,47 +1,101 @@
 """Unit tests for UDP Socket."""
 
 import socket
+import sys
 import pytest
 from yx.transport import UDPSocket
+from yx.transport.udp_socket import SOCKET_BUFFER_SIZE
+
+
+def _sysctl_int(name):
+    """Read an integer Linux sysctl, or None if unavailable."""
+    try:
+        with open(f"/proc/sys/{name.replace('.', '/')}") as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+@pytest.fixture(scope="module")
+def bound_udp():
+    """One configured UDPSocket bound to an ephemeral port, shared by the module."""
+    udp = UDPSocket(port=0)
+    udp.create_socket()
+    udp.bind()
+    yield udp
+    udp.close()
 
 
 class TestUDPSocket:
     """Test UDP socket configuration."""
 
-    def test_create_socket(self):
+    def test_create_socket(self, bound_udp):
         """Test socket creation."""
-        udp = UDPSocket(port=50001)
-        sock = udp.create_socket()
+        sock = bound_udp.socket
 
         assert sock is not None
         assert sock.type == socket.SOCK_DGRAM
 
-        udp.close()
-
-    def test_bind_socket(self):
+    def test_bind_socket(self, bound_udp):
         """Test socket binding."""
-        udp = UDPSocket(port=50002)
-        udp.bind()
-
-        # Socket should be bound
-        assert udp.socket is not None
-
-        udp.close()
+        # Socket should be bound (kernel assigned a port)
+        assert bound_udp.socket is not None
+        assert bound_udp.socket.getsockname()[1] != 0
 
-    def test_socket_has_broadcast(self):
+    def test_socket_has_broadcast(self, bound_udp):
         """Test that socket has broadcast enabled."""
-        udp = UDPSocket(port=50003)
-        sock = udp.create_socket()
-
         # Check SO_BROADCAST is set (non-zero means enabled)
-        broadcast = sock.getsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST)
+        broadcast = bound_udp.socket.getsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST)
         assert broadcast != 0
 
-        udp.close()
+    @pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="requires SO_REUSEPORT")
+    def test_socket_has_reuseport(self, bound_udp):
+        """Test that SO_REUSEPORT is enabled so listeners can share a port."""
+        reuseport = bound_udp.socket.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT)
+        assert reuseport != 0
+
+    def test_socket_buffers_not_smaller_than_default(self, bound_udp):
+        """Test that send/receive buffers are enlarged (never shrunk)."""
+        sock = bound_udp.socket
+
+        plain = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+                configured = sock.getsockopt(socket.SOL_SOCKET, option)
+                default = plain.getsockopt(socket.SOL_SOCKET, option)
+                assert configured >= default
+        finally:
+            plain.close()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux sysctl caps")
+    @pytest.mark.parametrize("option, cap", [
+        (socket.SO_RCVBUF, "net.core.rmem_max"),
+        (socket.SO_SNDBUF, "net.core.wmem_max"),
+    ], ids=["rcvbuf", "sndbuf"])
+    def test_socket_buffers_enlarged_to_requested_size(self, bound_udp, option, cap):
+        """Test that buffers reach SOCKET_BUFFER_SIZE, or the sysctl cap if lower."""
+        limit = _sysctl_int(cap)
+        if limit is None:
+            pytest.skip(f"{cap} not readable")
+
+        configured = bound_udp.socket.getsockopt(socket.SOL_SOCKET, option)
+
+        # Linux reports twice the requested size; *BUFFORCE may exceed the cap
+        assert configured >= min(SOCKET_BUFFER_SIZE, limit)
+
+    @pytest.mark.skipif(
+        not (hasattr(socket, "IP_MTU_DISCOVER") and hasattr(socket, "IP_PMTUDISC_DONT")),
+        reason="requires IP_MTU_DISCOVER"
+    )
+    def test_socket_never_sets_df(self, bound_udp):
+        """Test that path MTU discovery is off, so large datagrams fragment."""
+        mode = bound_udp.socket.getsockopt(socket.IPPROTO_IP, socket.IP_MTU_DISCOVER)
+        assert mode == socket.IP_PMTUDISC_DONT
 
     def test_close_socket(self):
         """Test socket closing."""
-        udp = UDPSocket(port=50004)
+        # Own socket: closing the shared fixture would break later tests
+        udp = UDPSocket(port=0)
         udp.create_socket()
         udp.close()
 
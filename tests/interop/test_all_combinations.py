@@ -13,13 +13,24 @@ Each test sends a packet from sender to receiver and validates the payload.
 
 import sys
 import os
+import asyncio
+import atexit
 import time
 import subprocess
 import json
+import shutil
+import string
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
+# Implementation source trees, resolved once to absolute paths
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+SWIFT_SRC = REPO_ROOT / "canonical" / "swift"
+PY_SRC = REPO_ROOT / "canonical" / "python" / "src"
+
 # Add Python implementation to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "canonical" / "python" / "src"))
+sys.path.insert(0, str(PY_SRC))
 
 from yx.transport import PacketBuilder, UDPSocket
 from yx.primitives import GUIDFactory
@@ -27,7 +38,19 @@ from yx.primitives import GUIDFactory
 # Test configuration
 TEST_PORT = 7777
 TEST_KEY = b'\x00' * 32  # Shared key for all tests
-TIMEOUT = 2.0
+TIMEOUT = 0.5  # Per-test budget; Swift build and first launch happen before timing
+TEST_GUID = GUIDFactory.generate()  # Python sender identity for the whole run
+
+# Swift toolchain; when swiftc is missing the Swift tests are skipped
+SWIFTC_BIN = shutil.which("swiftc")
+
+# Compiled Swift helpers, set by build_swift_binaries()
+HELPER_BIN = None
+RECEIVER_BIN = None
+
+# Persistent Swift sender process shared by all tests (see start_swift_helper)
+SWIFT_HELPER = None
+SWIFT_HELPER_LOCK = asyncio.Lock()
 
 class Colors:
     GREEN = '\033[92m'
@@ -37,298 +60,491 @@ class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
+# Output patterns, formatted once here rather than rebuilt on every print
+_RULE = f"{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.RESET}"
+_BANNER_OPEN = f"\n{_RULE}\n".encode()
+_BANNER_CLOSE = f"{_RULE}\n\n".encode()
+_HEADER_FMT = f"{Colors.BOLD}{Colors.BLUE}%s{Colors.RESET}\n"
+_TEST_FMT = f"{Colors.BOLD}Test %s: %s{Colors.RESET}"
+_SUCCESS_FMT = f"{Colors.GREEN}✅ %s{Colors.RESET}"
+_ERROR_FMT = f"{Colors.RED}❌ %s{Colors.RESET}"
+_INFO_FMT = f"{Colors.YELLOW}   %s{Colors.RESET}"
+
 def print_header(text):
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{text}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.RESET}\n")
+    # Flush pending print() output first so the raw writes stay in order
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    out.write(_BANNER_OPEN)
+    out.write((_HEADER_FMT % (text,)).encode())
+    out.write(_BANNER_CLOSE)
+    out.flush()
 
 def print_test(num, description):
-    print(f"{Colors.BOLD}Test {num}: {description}{Colors.RESET}")
+    print(_TEST_FMT % (num, description))
 
 def print_success(message):
-    print(f"{Colors.GREEN}✅ {message}{Colors.RESET}")
+    print(_SUCCESS_FMT % (message,))
 
 def print_error(message):
-    print(f"{Colors.RED}❌ {message}{Colors.RESET}")
+    print(_ERROR_FMT % (message,))
 
 def print_info(message):
-    print(f"{Colors.YELLOW}   {message}{Colors.RESET}")
+    print(_INFO_FMT % (message,))
 
-def create_swift_sender_script(payload_text):
-    """Create Swift script that sends a packet."""
-    script = f'''
+# Swift sources for the compiled helpers; only $key is filled in at build time
+_HELPER_TMPL = string.Template('''
 import Foundation
 import YXProtocol
 import Network
 
-let guid = GUIDFactory.generate()
-let key = Data(repeating: 0, count: 32)
-let payload = "{payload_text}".data(using: .utf8)!
-
-do {{
-    let socket = try UDPSocket(port: 0)  // Random sender port
-    try socket.sendPacket(guid: guid, payload: payload, key: key, to: "127.0.0.1", port: {TEST_PORT})
-    print("SENT: \\(payload_text)")
-}} catch {{
-    print("ERROR: \\(error)")
-    exit(1)
-}}
-'''
-    return script
-
-def create_swift_receiver_script():
-    """Create Swift script that receives and validates a packet."""
-    script = f'''
+let key = $key
+
+while let line = readLine() {
+    let parts = line.split(separator: " ", maxSplits: 2, omittingEmptySubsequences: false)
+    guard parts.count == 3, parts[0] == "send", let port = UInt16(parts[1]) else {
+        print("ERROR: bad command: \\(line)")
+        fflush(stdout)
+        continue
+    }
+    let payloads = parts[2].split(separator: "\\t", omittingEmptySubsequences: false)
+
+    do {
+        let socket = try UDPSocket(port: 0)  // Random sender port
+        for payloadText in payloads {
+            let payload = String(payloadText).data(using: .utf8)!
+            try socket.sendPacket(guid: GUIDFactory.generate(), payload: payload, key: key, to: "127.0.0.1", port: port)
+        }
+        print("SENT: \\(payloads.count)")
+    } catch {
+        print("ERROR: \\(error)")
+    }
+    fflush(stdout)
+}
+''')
+
+_RECEIVER_TMPL = string.Template('''
 import Foundation
 import YXProtocol
 import Network
 
-let key = Data(repeating: 0, count: 32)
-
-do {{
-    let socket = try UDPSocket(port: {TEST_PORT})
-
-    if let packet = try socket.receivePacket(key: key, timeout: {TIMEOUT}) {{
-        if let payload = String(data: packet.payload, encoding: .utf8) {{
-            print("RECEIVED: \\(payload)")
-        }} else {{
-            print("ERROR: Could not decode payload")
+let port = UInt16(CommandLine.arguments[1])!
+let timeout = Double(CommandLine.arguments[2])!
+let count = CommandLine.arguments.count > 3 ? Int(CommandLine.arguments[3])! : 1
+let deadline = Date().addingTimeInterval(timeout)
+let key = $key
+
+do {
+    let socket = try UDPSocket(port: port)
+    // UDPSocket(port:) only records the port; bind before announcing READY
+    try socket.bind()
+    print("READY")
+    fflush(stdout)
+
+    // All `count` packets share one deadline
+    for _ in 0..<count {
+        let remaining = max(deadline.timeIntervalSinceNow, 0)
+        if let packet = try socket.receivePacket(key: key, timeout: remaining) {
+            if let payload = String(data: packet.payload, encoding: .utf8) {
+                print("RECEIVED: \\(payload)")
+                fflush(stdout)
+            } else {
+                print("ERROR: Could not decode payload")
+                exit(1)
+            }
+        } else {
+            print("ERROR: No packet received")
             exit(1)
-        }}
-    }} else {{
-        print("ERROR: No packet received")
-        exit(1)
-    }}
-}} catch {{
+        }
+    }
+} catch {
     print("ERROR: \\(error)")
     exit(1)
-}}
-'''
-    return script
+}
+''')
+
+def swift_data_literal(data):
+    """Render bytes as a Swift `Data([...])` literal."""
+    return "Data([" + ", ".join(f"0x{b:02x}" for b in data) + "])"
+
+def create_swift_helper_script():
+    """Create long-lived Swift sender: one "send <port> <p1>\\t<p2>..." per stdin line."""
+    return _HELPER_TMPL.substitute(key=swift_data_literal(TEST_KEY))
 
-def run_swift_script(script, description):
-    """Run a Swift script and return output."""
-    script_path = Path("/tmp/yx_interop_test.swift")
-    script_path.write_text(script)
+def create_swift_receiver_script():
+    """Create Swift script that receives packets: yx_receiver <port> <timeout> [count]."""
+    return _RECEIVER_TMPL.substitute(key=swift_data_literal(TEST_KEY))
+
+def build_swift_binaries():
+    """Compile YXProtocol and the helper/receiver scripts once per run.
+
+    Each test then execs a prebuilt binary instead of having `swift`
+    recompile a script for every packet.
+    """
+    global HELPER_BIN, RECEIVER_BIN
+
+    build_dir = Path(tempfile.mkdtemp(prefix="yx_interop_"))
+    library_sources = sorted(str(p) for p in (SWIFT_SRC / "Sources" / "YXProtocol").rglob("*.swift"))
+
+    # (argv, stdin): generated scripts are piped in as "-", never written out
+    steps = [([
+        SWIFTC_BIN, "-O", "-parse-as-library", "-module-name", "YXProtocol",
+        "-emit-library", "-static", "-emit-module",
+        "-emit-module-path", str(build_dir / "YXProtocol.swiftmodule"),
+        "-o", str(build_dir / "libYXProtocol.a"),
+        *library_sources,
+    ], None)]
+    binaries = {}
+    for name, script in (("helper", create_swift_helper_script()),
+                         ("receiver", create_swift_receiver_script())):
+        binaries[name] = build_dir / f"yx_{name}"
+        steps.append(([
+            SWIFTC_BIN, "-O", "-I", str(build_dir), "-L", str(build_dir), "-lYXProtocol",
+            "-", "-o", str(binaries[name]),
+        ], script))
 
-    # Get path to Swift sources
-    swift_src = Path(__file__).parent.parent.parent / "canonical" / "swift"
+    try:
+        for cmd, script in steps:
+            # Only compiler diagnostics (stderr) are ever reported
+            result = subprocess.run(
+                cmd,
+                input=script.encode() if script else None,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=300
+            )
+            if result.returncode != 0:
+                print_error(f"Swift build failed: {result.stderr.decode().strip()}")
+                return False
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print_error(f"Swift build failed: {e}")
+        return False
 
-    # Compile and run
-    cmd = f"cd {swift_src} && swift /tmp/yx_interop_test.swift"
+    # Throwaway launch (ephemeral port, zero packets) so the first timed
+    # test does not pay for cold dynamic loading of the Swift runtime
     try:
+        # The receiver reports its own errors on stdout
         result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=TIMEOUT + 1
+            [str(binaries["receiver"]), "0", "0", "0"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=60
         )
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
-    except subprocess.TimeoutExpired:
-        return "", "TIMEOUT", 1
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print_error(f"Swift receiver warm-up failed: {e}")
+        return False
+    output = result.stdout.decode()
+    if "READY" not in output:
+        print_error(f"Swift receiver warm-up failed: {output.strip()}")
+        return False
+
+    HELPER_BIN = str(binaries["helper"])
+    RECEIVER_BIN = str(binaries["receiver"])
+    return True
 
-def test_python_to_python():
+async def wait_readable(sock, timeout):
+    """Wait on the event loop until `sock` is readable; False on timeout."""
+    if timeout <= 0:
+        return False
+    loop = asyncio.get_running_loop()
+    ready = loop.create_future()
+    loop.add_reader(sock, lambda: ready.done() or ready.set_result(None))
+    try:
+        await asyncio.wait_for(ready, timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        loop.remove_reader(sock)
+
+async def read_line(process, timeout=TIMEOUT):
+    """Read one stdout line from a Swift process; None on EOF or timeout."""
+    if timeout <= 0:
+        return None
+    try:
+        line = await asyncio.wait_for(process.stdout.readline(), timeout)
+    except asyncio.TimeoutError:
+        return None
+    return line.decode().strip() if line else None
+
+async def wait_for_line(process, prefix, timeout=TIMEOUT):
+    """Wait for a stdout line from `process` starting with `prefix`.
+
+    Returns the line, or None if the process exits or stays silent
+    until the deadline.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        line = await read_line(process, deadline - time.monotonic())
+        if line is None:
+            return None
+        if line.startswith(prefix):
+            return line
+
+async def wait_for_ready(process, timeout=TIMEOUT):
+    """Wait for a Swift receiver to print READY (socket bound)."""
+    return await wait_for_line(process, "READY", timeout) is not None
+
+async def receive_within(receiver, count, timeout=TIMEOUT):
+    """Receive `count` payloads on a non-blocking Python receiver.
+
+    All packets share one deadline; payloads are returned decoded, in
+    arrival order.
+
+    Raises:
+        TimeoutError: If fewer than `count` arrive before the deadline
+    """
+    deadline = time.monotonic() + timeout
+    payloads = []
+    while len(payloads) < count:
+        if not await wait_readable(receiver.socket, deadline - time.monotonic()):
+            raise TimeoutError(f"got {len(payloads)}/{count} packets within {timeout}s")
+        _, payload, _ = receiver.receive_packet(key=TEST_KEY)
+        payloads.append(payload.decode())
+    return payloads
+
+def kill_process(process):
+    """Kill a Swift child unless it has already exited."""
+    if process is not None and process.returncode is None:
+        process.kill()
+
+async def finish_swift_receiver(process, expected):
+    """Wait for a Swift receiver to report every payload in `expected`, then reap it.
+
+    Returns (received_payloads, stderr); received_payloads is None on failure.
+    """
+    deadline = time.monotonic() + TIMEOUT + 1
+    received = []
+    while len(received) < len(expected):
+        line = await wait_for_line(process, "RECEIVED: ", deadline - time.monotonic())
+        if line is None:
+            break
+        received.append(line[len("RECEIVED: "):])
+    if received != list(expected):
+        kill_process(process)
+        _, stderr = await process.communicate()
+        return None, stderr.decode() or f"received {received}"
+    await process.wait()
+    return received, ""
+
+async def start_swift_receiver(port, count):
+    """Launch a Swift receiver for `count` packets; None if it never binds."""
+    process = await asyncio.create_subprocess_exec(
+        RECEIVER_BIN, str(port), str(TIMEOUT), str(count),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    # Wait until the receiver has bound its socket
+    if not await wait_for_ready(process):
+        kill_process(process)
+        await process.wait()
+        return None
+    return process
+
+async def start_swift_helper():
+    """Launch the persistent Swift sender used by every Swift → * test."""
+    global SWIFT_HELPER
+    # stderr is never read: a pipe could fill up and stall the helper
+    SWIFT_HELPER = await asyncio.create_subprocess_exec(
+        HELPER_BIN,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+
+async def stop_swift_helper():
+    """Close the helper's stdin so it exits, killing it if it lingers."""
+    global SWIFT_HELPER
+    if SWIFT_HELPER is None:
+        return
+    try:
+        SWIFT_HELPER.stdin.close()
+        await asyncio.wait_for(SWIFT_HELPER.wait(), TIMEOUT)
+    except (OSError, asyncio.TimeoutError):
+        kill_process(SWIFT_HELPER)
+        await SWIFT_HELPER.wait()
+    SWIFT_HELPER = None
+
+async def swift_send(payloads, port):
+    """Ask the Swift helper to send `payloads` in one command; returns its reply line."""
+    async with SWIFT_HELPER_LOCK:
+        SWIFT_HELPER.stdin.write(f"send {port} {chr(9).join(payloads)}\n".encode())
+        await SWIFT_HELPER.stdin.drain()
+        return await read_line(SWIFT_HELPER) or "ERROR: no reply from Swift helper"
+
+# Python sockets created by _recv_sock/_send_sock, closed once at exit
+_OPEN_SOCKETS = []
+
+@lru_cache(maxsize=None)
+def _recv_sock(port):
+    """Bound Python receiver for `port`, created once per run."""
+    receiver = UDPSocket(port=port)
+    # create_socket() already sets SO_REUSEADDR/SO_REUSEPORT, so a quick
+    # rerun rebinds immediately without retry loops
+    receiver.bind()
+    # Waits go through wait_readable, never a blocking recvfrom
+    receiver.socket.setblocking(False)
+    _OPEN_SOCKETS.append(receiver)
+    return receiver
+
+@lru_cache(maxsize=None)
+def _send_sock(port):
+    """Python sender used for packets to `port`, created once per run.
+
+    Keyed by destination so concurrent tests never interleave on one
+    UDPSocket's per-sender GUID/key cache.
+    """
+    sender = UDPSocket(port=0)  # Random port
+    _OPEN_SOCKETS.append(sender)
+    return sender
+
+@atexit.register
+def _close_sockets():
+    for sock in _OPEN_SOCKETS:
+        sock.close()
+
+# The check_* coroutines below are driven by run_tests() and
+# test_python_interop.py, not collected by pytest
+
+def python_send(payloads, port):
+    """Send `payloads` from the cached Python sender in one batched call."""
+    sender = _send_sock(port)
+    addr = ("127.0.0.1", port)
+    sender.send_packets(
+        [(TEST_GUID, payload.encode(), addr) for payload in payloads],
+        key=TEST_KEY
+    )
+
+async def check_python_to_python(port=TEST_PORT, payloads=("Python to Python test",)):
     """Test 1: Python sender → Python receiver"""
     print_test(1, "Python → Python")
 
     try:
         # Create receiver
-        receiver = UDPSocket(port=TEST_PORT)
-        receiver.bind()
-        receiver.socket.settimeout(TIMEOUT)
-        print_info(f"Python receiver listening on port {TEST_PORT}")
-        time.sleep(0.1)
-
-        # Create sender
-        sender = UDPSocket(port=0)  # Random port
-        guid = GUIDFactory.generate()
-        payload = b"Python to Python test"
-
-        # Send packet
-        sender.send_packet(guid=guid, payload=payload, key=TEST_KEY, host="127.0.0.1", port=TEST_PORT)
-        print_info(f"Python sender sent: {payload.decode()}")
-
-        # Receive packet
-        recv_guid, recv_payload, addr = receiver.receive_packet(key=TEST_KEY)
-
-        if recv_payload == payload:
-            print_success(f"Python receiver got: {recv_payload.decode()}")
-            receiver.close()
-            sender.close()
+        receiver = _recv_sock(port)
+        print_info(f"Python receiver listening on port {port}")
+
+        # Send packets
+        python_send(payloads, port)
+        print_info(f"Python sender sent: {', '.join(payloads)}")
+
+        # Receive packets
+        received = await receive_within(receiver, len(payloads))
+
+        if received == list(payloads):
+            print_success(f"Python receiver got: {', '.join(received)}")
             return True
         else:
             print_error("Payload mismatch")
-            receiver.close()
-            sender.close()
             return False
 
     except Exception as e:
         print_error(f"Exception: {e}")
-        try:
-            receiver.close()
-            sender.close()
-        except:
-            pass
         return False
 
-def test_python_to_swift():
+async def check_python_to_swift(port=TEST_PORT, payloads=("Python to Swift test",)):
     """Test 2: Python sender → Swift receiver"""
     print_test(2, "Python → Swift")
 
+    if SWIFTC_BIN is None:
+        print_info("swiftc not found; skipping")
+        return None
+
+    receiver_process = None
     try:
         # Start Swift receiver
-        swift_receiver = create_swift_receiver_script()
-        script_path = Path("/tmp/yx_receiver.swift")
-        script_path.write_text(swift_receiver)
-
-        swift_src = Path(__file__).parent.parent.parent / "canonical" / "swift"
-        cmd = f"cd {swift_src} && swift /tmp/yx_receiver.swift"
-
-        print_info(f"Swift receiver listening on port {TEST_PORT}")
-        receiver_process = subprocess.Popen(
-            cmd,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-
-        # Give receiver time to start
-        time.sleep(0.5)
+        print_info(f"Swift receiver listening on port {port}")
+        receiver_process = await start_swift_receiver(port, len(payloads))
+        if receiver_process is None:
+            print_error("Swift receiver did not become ready")
+            return False
 
         # Send from Python
-        sender = UDPSocket(port=0)
-        guid = GUIDFactory.generate()
-        payload = b"Python to Swift test"
-
-        sender.send_packet(guid=guid, payload=payload, key=TEST_KEY, host="127.0.0.1", port=TEST_PORT)
-        print_info(f"Python sender sent: {payload.decode()}")
+        python_send(payloads, port)
+        print_info(f"Python sender sent: {', '.join(payloads)}")
 
         # Wait for Swift to receive
-        stdout, stderr = receiver_process.communicate(timeout=TIMEOUT + 1)
+        received, stderr = await finish_swift_receiver(receiver_process, payloads)
 
-        if "RECEIVED: Python to Swift test" in stdout:
-            print_success(f"Swift receiver got: {stdout.split('RECEIVED: ')[1].strip()}")
-            sender.close()
+        if received is not None:
+            print_success(f"Swift receiver got: {', '.join(received)}")
             return True
         else:
             print_error(f"Swift receiver failed: {stderr}")
-            sender.close()
             return False
 
     except Exception as e:
         print_error(f"Exception: {e}")
-        try:
-            receiver_process.kill()
-        except:
-            pass
+        kill_process(receiver_process)
         return False
 
-def test_swift_to_python():
+async def check_swift_to_python(port=TEST_PORT, payloads=("Swift to Python test",)):
     """Test 3: Swift sender → Python receiver"""
     print_test(3, "Swift → Python")
 
+    if SWIFTC_BIN is None:
+        print_info("swiftc not found; skipping")
+        return None
+
     try:
         # Start Python receiver
-        receiver = UDPSocket(port=TEST_PORT)
-        receiver.bind()
-        receiver.socket.settimeout(TIMEOUT)
-        print_info(f"Python receiver listening on port {TEST_PORT}")
-        time.sleep(0.1)
+        receiver = _recv_sock(port)
+        print_info(f"Python receiver listening on port {port}")
 
         # Send from Swift
-        payload_text = "Swift to Python test"
-        swift_sender = create_swift_sender_script(payload_text)
-
-        swift_src = Path(__file__).parent.parent.parent / "canonical" / "swift"
-        script_path = Path("/tmp/yx_sender.swift")
-        script_path.write_text(swift_sender)
-
-        cmd = f"cd {swift_src} && swift /tmp/yx_sender.swift"
-        sender_process = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=TIMEOUT
-        )
+        reply = await swift_send(payloads, port)
 
-        if "SENT:" in sender_process.stdout:
-            print_info(f"Swift sender sent: {payload_text}")
+        if reply.startswith("SENT:"):
+            print_info(f"Swift sender sent: {', '.join(payloads)}")
         else:
-            print_error(f"Swift sender failed: {sender_process.stderr}")
-            receiver.close()
+            print_error(f"Swift sender failed: {reply}")
             return False
 
         # Receive in Python
-        recv_guid, recv_payload, addr = receiver.receive_packet(key=TEST_KEY)
+        received = await receive_within(receiver, len(payloads))
 
-        if recv_payload.decode() == payload_text:
-            print_success(f"Python receiver got: {recv_payload.decode()}")
-            receiver.close()
+        if received == list(payloads):
+            print_success(f"Python receiver got: {', '.join(received)}")
             return True
         else:
             print_error("Payload mismatch")
-            receiver.close()
             return False
 
     except Exception as e:
         print_error(f"Exception: {e}")
         return False
 
-def test_swift_to_swift():
+async def check_swift_to_swift(port=TEST_PORT, payloads=("Swift to Swift test",)):
     """Test 4: Swift sender → Swift receiver"""
     print_test(4, "Swift → Swift")
 
+    if SWIFTC_BIN is None:
+        print_info("swiftc not found; skipping")
+        return None
+
+    receiver_process = None
     try:
         # Start Swift receiver
-        swift_receiver = create_swift_receiver_script()
-        script_path = Path("/tmp/yx_receiver.swift")
-        script_path.write_text(swift_receiver)
-
-        swift_src = Path(__file__).parent.parent.parent / "canonical" / "swift"
-        cmd = f"cd {swift_src} && swift /tmp/yx_receiver.swift"
-
-        print_info(f"Swift receiver listening on port {TEST_PORT}")
-        receiver_process = subprocess.Popen(
-            cmd,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-
-        # Give receiver time to start
-        time.sleep(0.5)
+        print_info(f"Swift receiver listening on port {port}")
+        receiver_process = await start_swift_receiver(port, len(payloads))
+        if receiver_process is None:
+            print_error("Swift receiver did not become ready")
+            return False
 
         # Send from Swift
-        payload_text = "Swift to Swift test"
-        swift_sender = create_swift_sender_script(payload_text)
-        sender_script_path = Path("/tmp/yx_sender.swift")
-        sender_script_path.write_text(swift_sender)
-
-        cmd = f"cd {swift_src} && swift /tmp/yx_sender.swift"
-        sender_process = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=TIMEOUT
-        )
+        reply = await swift_send(payloads, port)
 
-        if "SENT:" in sender_process.stdout:
-            print_info(f"Swift sender sent: {payload_text}")
+        if reply.startswith("SENT:"):
+            print_info(f"Swift sender sent: {', '.join(payloads)}")
         else:
-            print_error(f"Swift sender failed: {sender_process.stderr}")
-            receiver_process.kill()
+            print_error(f"Swift sender failed: {reply}")
+            kill_process(receiver_process)
             return False
 
         # Wait for Swift to receive
-        stdout, stderr = receiver_process.communicate(timeout=TIMEOUT + 1)
+        received, stderr = await finish_swift_receiver(receiver_process, payloads)
 
-        if "RECEIVED: Swift to Swift test" in stdout:
-            print_success(f"Swift receiver got: {stdout.split('RECEIVED: ')[1].strip()}")
+        if received is not None:
+            print_success(f"Swift receiver got: {', '.join(received)}")
             return True
         else:
             print_error(f"Swift receiver failed: {stderr}")
@@ -336,42 +552,56 @@ def test_swift_to_swift():
 
     except Exception as e:
         print_error(f"Exception: {e}")
-        try:
-            receiver_process.kill()
-        except:
-            pass
+        kill_process(receiver_process)
         return False
 
+async def run_tests(tests, swift_ready):
+    """Run every test concurrently on one event loop, one port each."""
+    if swift_ready:
+        await start_swift_helper()
+    try:
+        return await asyncio.gather(*(
+            test(TEST_PORT + i) for i, (_, test) in enumerate(tests)
+        ))
+    finally:
+        await stop_swift_helper()
+
 def main():
     print_header("YX Protocol - Comprehensive Interoperability Test")
-    print(f"Testing all 4 combinations on localhost:{TEST_PORT}")
+    print(f"Testing all 4 combinations on localhost:{TEST_PORT}-{TEST_PORT + 3}")
     print(f"Using shared 32-byte key: {TEST_KEY.hex()[:32]}...")
 
-    results = []
-
-    # Test 1: Python → Python
-    results.append(("Python → Python", test_python_to_python()))
-    time.sleep(0.5)
-
-    # Test 2: Python → Swift
-    results.append(("Python → Swift", test_python_to_swift()))
-    time.sleep(0.5)
-
-    # Test 3: Swift → Python
-    results.append(("Swift → Python", test_swift_to_python()))
-    time.sleep(0.5)
-
-    # Test 4: Swift → Swift
-    results.append(("Swift → Swift", test_swift_to_swift()))
+    # Compile Swift once, before any timed test
+    if SWIFTC_BIN is None:
+        swift_ready = False
+        print_info("swiftc not found; Swift tests will be skipped")
+    else:
+        swift_ready = build_swift_binaries()
+        if not swift_ready:
+            print_info("Swift tests will fail without the compiled helpers")
+
+    # The four tests are independent: run them concurrently, one port each
+    tests = [
+        ("Python → Python", check_python_to_python),
+        ("Python → Swift", check_python_to_swift),
+        ("Swift → Python", check_swift_to_python),
+        ("Swift → Swift", check_swift_to_swift),
+    ]
+    outcomes = asyncio.run(run_tests(tests, swift_ready))
+    results = [(name, outcome) for (name, _), outcome in zip(tests, outcomes)]
 
     # Summary
     print_header("Test Results Summary")
 
     passed = 0
     failed = 0
+    skipped = 0
 
     for name, result in results:
-        if result:
+        if result is None:
+            print_info(f"{name}: SKIPPED")
+            skipped += 1
+        elif result:
             print_success(f"{name}: PASSED")
             passed += 1
         else:
@@ -379,12 +609,17 @@ def main():
             failed += 1
 
     print(f"\n{Colors.BOLD}{'='*70}{Colors.RESET}")
-    print(f"{Colors.BOLD}Total: {passed + failed} tests{Colors.RESET}")
+    print(f"{Colors.BOLD}Total: {passed + failed + skipped} tests{Colors.RESET}")
     print(f"{Colors.GREEN}Passed: {passed}{Colors.RESET}")
     print(f"{Colors.RED}Failed: {failed}{Colors.RESET}")
+    print(f"{Colors.YELLOW}Skipped: {skipped}{Colors.RESET}")
     print(f"{Colors.BOLD}{'='*70}{Colors.RESET}\n")
 
-    if failed == 0:
+    if failed == 0 and skipped:
+        print(f"{Colors.GREEN}{Colors.BOLD}✅ ALL RUN TESTS PASSED{Colors.RESET}")
+        print(f"{Colors.YELLOW}Swift tests skipped: install the Swift toolchain to check interoperability.{Colors.RESET}\n")
+        return 0
+    elif failed == 0:
         print(f"{Colors.GREEN}{Colors.BOLD}✅ ALL INTEROPERABILITY TESTS PASSED!{Colors.RESET}")
         print(f"{Colors.GREEN}Python and Swift implementations are fully interoperable.{Colors.RESET}\n")
         return 0